@@ -2,18 +2,20 @@
 import serial
 import serial.tools.list_ports
 import csv
+import atexit
+import signal
+import selectors
 import logging
-from datetime import datetime, timezone
 import time
 import sys
-import platform
 import os
 
 # Import configuration
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from config import get_config, get_default_serial_ports
+from config import get_config, get_default_serial_ports, SYSTEM
 from utils.logging_config import setup_logging
 from services.serial_manager import get_serial_manager
+from utils.timezone_utils import utc_now_iso
 
 # Set up logging
 setup_logging()
@@ -27,6 +29,10 @@ BAUD_RATE = Config.SERIAL_BAUD_RATE
 CSV_FILE = Config.TEMP_DATA_CSV_FILE
 DEFAULT_PORTS = get_default_serial_ports()
 
+# A reading is a few bytes; a fragment longer than this is noise (wrong baud
+# rate, binary output), so it is dropped rather than buffered indefinitely
+MAX_PARTIAL_LINE_BYTES = 512
+
 
 def find_arduino_port():
     """Auto-detect Arduino serial port by checking common ports."""
@@ -73,9 +79,46 @@ def ensure_csv_header(file_path):
             writer = csv.writer(f)
             writer.writerow(['recordedAt', 'tempC'])
 
+def open_csv_appender(file_path):
+    """
+    Open a long-lived, buffered binary append handle to the CSV file.
+    
+    Keeping the handle open avoids an open/close pair for every reading;
+    rows accumulate in the userspace buffer until flushed. Rows are written
+    as pre-encoded bytes, skipping the text-mode encoding layer. The handle
+    is closed (and flushed) automatically on interpreter exit.
+    """
+    csv_file = open(file_path, 'ab', buffering=1 << 16)
+    atexit.register(csv_file.close)
+    return csv_file
+
+def open_serial_selector(ser):
+    """
+    Register the serial port's file descriptor with a selector.
+    
+    Args:
+        ser: Open serial.Serial instance
+    
+    Returns:
+        A selector watching the port for readable data, or None when the port
+        has no pollable descriptor (e.g. on Windows)
+    """
+    try:
+        selector = selectors.DefaultSelector()
+        selector.register(ser.fileno(), selectors.EVENT_READ)
+    except (AttributeError, OSError, ValueError) as e:
+        logger.info(f"Serial port is not pollable, falling back to timed reads: {e}")
+        return None
+    return selector
+
+def handle_sigterm(signum, frame):
+    """Exit cleanly on SIGTERM so buffered CSV rows are flushed on exit."""
+    logger.info("Received SIGTERM, stopping serial ingest")
+    sys.exit(0)
+
 def check_permissions(port_path):
     """Check if user has permissions to access the serial port."""
-    if platform.system() == 'Linux':
+    if SYSTEM == 'Linux':
         if not os.access(port_path, os.R_OK | os.W_OK):
             logger.error(f"Permission denied for {port_path}")
             print(f"\n⚠️  Permission denied for {port_path}")
@@ -109,54 +152,87 @@ def main():
     if not check_permissions(serial_port):
         sys.exit(1)
     
+    # Exit through sys.exit on SIGTERM (e.g. systemd stop) so atexit handlers run
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    
     logger.info(f"Connecting to serial port {serial_port} at {BAUD_RATE} baud...")
     print(f"Connecting to serial port {serial_port} at {BAUD_RATE} baud...")
     
+    COMMAND_CHECK_INTERVAL = 0.5  # Check for commands every 0.5 seconds
+    
     try:
-        ser = serial.Serial(serial_port, BAUD_RATE, timeout=Config.SERIAL_TIMEOUT)
+        # readline() blocks until a line arrives; the timeout bounds how long
+        # pending Arduino commands can wait for the next check
+        ser = serial.Serial(
+            serial_port,
+            BAUD_RATE,
+            timeout=min(Config.SERIAL_TIMEOUT, COMMAND_CHECK_INTERVAL)
+        )
         logger.info(f"Connected to serial port {serial_port}. Writing to {CSV_FILE}")
         print(f"✅ Connected! Reading data and writing to {CSV_FILE}")
         print("Press Ctrl+C to stop\n")
         
         ensure_csv_header(CSV_FILE)
+        csv_file = open_csv_appender(CSV_FILE)
+        rows_since_flush = 0
+        last_flush = time.monotonic()
+        partial_line = b''
+        
+        # Wait on the port's descriptor where possible so the loop only wakes
+        # for incoming data or when the command queue is due to be checked
+        selector = open_serial_selector(ser)
         
         # Initialize serial manager for command processing
         serial_manager = get_serial_manager()
-        last_command_check = time.time()
-        COMMAND_CHECK_INTERVAL = 0.5  # Check for commands every 0.5 seconds
+        next_command_check = time.monotonic()
         
         while True:
             # Check for pending commands and send them
-            current_time = time.time()
-            if current_time - last_command_check >= COMMAND_CHECK_INTERVAL:
+            if time.monotonic() >= next_command_check:
                 pending_commands = serial_manager.get_pending_commands()
-                for cmd in pending_commands:
+                if pending_commands:
                     try:
-                        command = cmd.get('command', '')
-                        command_timestamp = cmd.get('timestamp', 0)
+                        commands = [cmd.get('command', '') for cmd in pending_commands]
                         
-                        # Send command to Arduino
-                        command_with_newline = f"{command}\n"
-                        ser.write(command_with_newline.encode('utf-8'))
+                        # Send all queued commands to Arduino in one write (one line each)
+                        ser.write(b''.join(f"{command}\n".encode('utf-8') for command in commands))
                         ser.flush()
                         
-                        logger.info(f"Sent queued command '{command}' to Arduino")
-                        print(f"📤 Sent command: {command}")
+                        for command in commands:
+                            logger.info(f"Sent queued command '{command}' to Arduino")
+                            print(f"📤 Sent command: {command}")
                         
-                        # Mark command as processed
-                        serial_manager.mark_command_processed(command_timestamp)
+                        # Mark the batch as processed with a single queue update
+                        serial_manager.mark_commands_processed(
+                            [cmd.get('timestamp', 0) for cmd in pending_commands]
+                        )
                     except Exception as e:
-                        logger.error(f"Error sending queued command: {e}", exc_info=True)
-                        print(f"⚠️  Error sending command: {e}")
+                        logger.error(f"Error sending queued commands: {e}", exc_info=True)
+                        print(f"⚠️  Error sending commands: {e}")
                 
-                last_command_check = current_time
+                next_command_check = time.monotonic() + COMMAND_CHECK_INTERVAL
             
-            # Read temperature data from Arduino
-            if ser.in_waiting > 0:
-                try:
-                    # Read line from serial
+            # Read temperature data from Arduino (blocks in the kernel until data or timeout)
+            try:
+                if selector is None or selector.select(timeout=max(0.0, next_command_check - time.monotonic())):
                     raw_line = ser.readline()
-                    
+                else:
+                    raw_line = b''
+                
+                # A timeout can split a line; keep the fragment until the rest arrives
+                if raw_line and not raw_line.endswith(b'\n'):
+                    partial_line += raw_line
+                    raw_line = b''
+                    if len(partial_line) > MAX_PARTIAL_LINE_BYTES:
+                        logger.warning(
+                            f"Discarding {len(partial_line)} bytes of serial input without a newline"
+                        )
+                        partial_line = b''
+                elif raw_line and partial_line:
+                    raw_line = partial_line + raw_line
+                    partial_line = b''
+                
+                if raw_line:
                     # Decode with error handling
                     try:
                         line = raw_line.decode('utf-8').strip()
@@ -181,24 +257,31 @@ def main():
                             continue
                         
                         # Generate timestamp
-                        timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+                        timestamp = utc_now_iso()
                         
-                        # Append to CSV file (Path object works with open() in Python 3.6+)
-                        with open(CSV_FILE, 'a', newline='', encoding='utf-8') as f:
-                            writer = csv.writer(f)
-                            writer.writerow([timestamp, tempC])
+                        # Append to CSV file via the persistent (buffered) handle. Neither
+                        # field ever needs quoting, so skip csv.writer; \r\n matches its rows
+                        csv_file.write(f"{timestamp},{tempC}\r\n".encode('ascii'))
+                        rows_since_flush += 1
                         
                         logger.debug(f"Temperature reading: {tempC}°C at {timestamp}")
                         print(f"[{timestamp}] {tempC}°C")
                         
-                except ValueError as e:
-                    logger.warning(f"Error parsing line '{line if 'line' in locals() else 'unknown'}': {e}")
-                    print(f"⚠️  Error parsing line: {e}")
-                except Exception as e:
-                    logger.error(f"Error processing data: {e}", exc_info=True)
-                    print(f"⚠️  Error processing data: {e}")
+            except ValueError as e:
+                logger.warning(f"Error parsing line '{line if 'line' in locals() else 'unknown'}': {e}")
+                print(f"⚠️  Error parsing line: {e}")
+            except Exception as e:
+                logger.error(f"Error processing data: {e}", exc_info=True)
+                print(f"⚠️  Error processing data: {e}")
             
-            time.sleep(Config.SERIAL_READ_DELAY)  # Small delay to prevent CPU spinning
+            # Flush buffered rows every N rows or every T seconds, whichever comes first
+            if rows_since_flush and (
+                rows_since_flush >= Config.SERIAL_CSV_FLUSH_ROWS
+                or time.monotonic() - last_flush >= Config.SERIAL_CSV_FLUSH_INTERVAL
+            ):
+                csv_file.flush()
+                rows_since_flush = 0
+                last_flush = time.monotonic()
             
     except serial.SerialException as e:
         logger.error(f"Serial port error: {e}", exc_info=True)
@@ -207,14 +290,14 @@ def main():
         print(f"1. Arduino is connected and powered on")
         print(f"2. Serial port is correct: {serial_port}")
         print(f"3. No other program is using the serial port")
-        if platform.system() == 'Linux':
+        if SYSTEM == 'Linux':
             print(f"4. You have permissions (run: groups | grep dialout)")
         list_available_ports()
         sys.exit(1)
     except PermissionError as e:
         logger.error(f"Permission denied: {e}", exc_info=True)
         print(f"❌ Permission denied: {e}")
-        if platform.system() == 'Linux':
+        if SYSTEM == 'Linux':
             print("\nOn Raspberry Pi, add your user to the dialout group:")
             print("  sudo usermod -a -G dialout $USER")
             print("Then log out and back in, or restart.")
@@ -225,6 +308,10 @@ def main():
         if 'ser' in locals():
             ser.close()
             logger.info("Serial port closed")
+        if 'csv_file' in locals():
+            csv_file.close()
+        if locals().get('selector') is not None:
+            selector.close()
         print("✅ Disconnected")
         sys.exit(0)
     except Exception as e:
@@ -5,18 +5,29 @@ This module provides configuration settings with environment variable support.
 All settings can be overridden via environment variables.
 """
 import os
+import platform
 from pathlib import Path
 from typing import List, Type
 
+# Host OS, resolved once at import (platform.system() calls uname() under the hood)
+SYSTEM = platform.system()
+
 
 class Config:
     """Configuration class with default settings."""
     
     # Flask configuration
     SECRET_KEY = os.environ.get('SECRET_KEY', 'secret-key')
-    DEBUG = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
+    # Unset means production: CORS is left to the reverse proxy and the debugger
+    # stays off unless a deployment opts in with FLASK_ENV=development
+    ENV = os.environ.get('FLASK_ENV', 'production')
+    # Debugger and reloader follow ENV; FLASK_DEBUG overrides
+    DEBUG = os.environ.get('FLASK_DEBUG', str(ENV == 'development')).lower() == 'true'
+    # Applied to app.json in main.py (Flask 3 no longer reads these keys itself)
     JSON_SORT_KEYS = False
-    JSONIFY_PRETTYPRINT_REGULAR = True
+    JSONIFY_PRETTYPRINT_REGULAR = False
+    # Reject request bodies larger than this (bytes) with 413 before they are read or parsed
+    MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 16 * 1024))
     
     # Server configuration
     HOST = os.environ.get('HOST', '0.0.0.0')
@@ -43,22 +54,28 @@ class Config:
     # Serial communication configuration
     SERIAL_BAUD_RATE = int(os.environ.get('SERIAL_BAUD_RATE', 9600))
     SERIAL_TIMEOUT = float(os.environ.get('SERIAL_TIMEOUT', 1.0))
-    SERIAL_READ_DELAY = float(os.environ.get('SERIAL_READ_DELAY', 0.1))
+    SERIAL_CSV_FLUSH_ROWS = int(os.environ.get('SERIAL_CSV_FLUSH_ROWS', 10))  # Flush CSV buffer every N rows
+    SERIAL_CSV_FLUSH_INTERVAL = float(os.environ.get('SERIAL_CSV_FLUSH_INTERVAL', 5.0))  # ...or every T seconds
     
     # Arduino vendor IDs for auto-detection
-    ARDUINO_VENDOR_IDS = [0x2341, 0x2A03, 0x239A]  # Arduino, Adafruit, etc.
+    ARDUINO_VENDOR_IDS = frozenset({0x2341, 0x2A03, 0x239A})  # Arduino, Adafruit, etc.
     
     # Rate limiting configuration
     RATE_LIMIT_MAX_ATTEMPTS = int(os.environ.get('RATE_LIMIT_MAX_ATTEMPTS', 5))
     RATE_LIMIT_WINDOW_SECONDS = int(os.environ.get('RATE_LIMIT_WINDOW_SECONDS', 300))  # 5 minutes
     RATE_LIMIT_LOCKOUT_DURATION = int(os.environ.get('RATE_LIMIT_LOCKOUT_DURATION', 900))  # 15 minutes
     RATE_LIMIT_RESET_KEY = os.environ.get('RATE_LIMIT_RESET_KEY', 'clear')
+    # Reverse proxies (comma-separated CIDRs) whose X-Forwarded-For is trusted for the client IP
+    TRUSTED_PROXY_CIDRS = [c.strip() for c in os.environ.get('TRUSTED_PROXY_CIDRS', '').split(',') if c.strip()]
     
     # JWT configuration
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', SECRET_KEY)  # Use SECRET_KEY if not set
     JWT_ALGORITHM = os.environ.get('JWT_ALGORITHM', 'HS256')
     JWT_ACCESS_TOKEN_EXPIRES_IN = int(os.environ.get('JWT_ACCESS_TOKEN_EXPIRES_IN', 900))  # 15 minutes
     JWT_REFRESH_TOKEN_EXPIRES_IN = int(os.environ.get('JWT_REFRESH_TOKEN_EXPIRES_IN', 604800))  # 7 days
+    
+    # Password hashing configuration (bcrypt work factor; each +1 doubles hashing time)
+    BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
 
 
 def get_default_serial_ports() -> List[str]:
@@ -68,15 +85,12 @@ def get_default_serial_ports() -> List[str]:
     Returns:
         List of default serial port names for the current platform.
     """
-    import platform
-    system = platform.system()
-    
-    if system == 'Windows':
+    if SYSTEM == 'Windows':
         return ['COM3', 'COM4', 'COM5']
-    elif system == 'Linux':
+    elif SYSTEM == 'Linux':
         # Raspberry Pi common ports
         return ['/dev/ttyUSB0', '/dev/ttyACM0', '/dev/ttyAMA0']
-    elif system == 'Darwin':  # macOS
+    elif SYSTEM == 'Darwin':  # macOS
         return ['/dev/tty.usbserial', '/dev/tty.usbmodem']
     else:
         return []
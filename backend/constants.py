@@ -7,6 +7,7 @@ HTTP_BAD_REQUEST = 400
 HTTP_UNAUTHORIZED = 401
 HTTP_FORBIDDEN = 403
 HTTP_NOT_FOUND = 404
+HTTP_PAYLOAD_TOO_LARGE = 413
 HTTP_UNPROCESSABLE_ENTITY = 422
 HTTP_TOO_MANY_REQUESTS = 429
 HTTP_INTERNAL_SERVER_ERROR = 500
@@ -18,6 +19,7 @@ STATUS_BAD_REQUEST = HTTP_BAD_REQUEST
 STATUS_UNAUTHORIZED = HTTP_UNAUTHORIZED
 STATUS_FORBIDDEN = HTTP_FORBIDDEN
 STATUS_NOT_FOUND = HTTP_NOT_FOUND
+STATUS_PAYLOAD_TOO_LARGE = HTTP_PAYLOAD_TOO_LARGE
 STATUS_UNPROCESSABLE_ENTITY = HTTP_UNPROCESSABLE_ENTITY
 STATUS_TOO_MANY_REQUESTS = HTTP_TOO_MANY_REQUESTS
 STATUS_INTERNAL_SERVER_ERROR = HTTP_INTERNAL_SERVER_ERROR
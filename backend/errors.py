@@ -1,13 +1,16 @@
 """Error handlers for the Flask application."""
 import logging
-from typing import Tuple
+from typing import Dict, Tuple
+import orjson
 from flask import Flask, jsonify, Response
+from werkzeug.exceptions import default_exceptions
 from exceptions import APIException
 from constants import (
     HTTP_BAD_REQUEST,
     HTTP_UNAUTHORIZED,
     HTTP_FORBIDDEN,
     HTTP_NOT_FOUND,
+    HTTP_PAYLOAD_TOO_LARGE,
     HTTP_UNPROCESSABLE_ENTITY,
     HTTP_TOO_MANY_REQUESTS,
     HTTP_INTERNAL_SERVER_ERROR
@@ -15,6 +18,63 @@ from constants import (
 
 logger = logging.getLogger(__name__)
 
+# Default error messages per status code, used when an error carries no message
+_DEFAULT_ERROR_MESSAGES: Dict[int, str] = {
+    HTTP_BAD_REQUEST: 'Bad request',
+    HTTP_UNAUTHORIZED: 'Unauthorized',
+    HTTP_FORBIDDEN: 'Forbidden',
+    HTTP_NOT_FOUND: 'Not found',
+    HTTP_PAYLOAD_TOO_LARGE: 'Payload too large',
+    HTTP_UNPROCESSABLE_ENTITY: 'Unprocessable entity',
+    HTTP_TOO_MANY_REQUESTS: 'Too many requests',
+    HTTP_INTERNAL_SERVER_ERROR: 'Internal server error',
+}
+
+def _stock_error_bodies() -> Dict[Tuple[int, str], bytes]:
+    """
+    Pre-serialize the error bodies whose messages actually repeat.
+    
+    str() of a werkzeug HTTPException is never empty, so the handlers see each
+    code's stock text (e.g. "404 Not Found: The requested URL was not found on
+    the server...") from abort(code) and unmatched routes rather than the short
+    _DEFAULT_ERROR_MESSAGES. Only the 500 handler always uses its default.
+    
+    Returns:
+        {(status_code, message): compact JSON body, as jsonify emits it}
+    """
+    messages = [
+        (status_code, str(default_exceptions[status_code]()))
+        for status_code in _DEFAULT_ERROR_MESSAGES
+        if status_code != HTTP_INTERNAL_SERVER_ERROR
+    ]
+    messages.append((HTTP_INTERNAL_SERVER_ERROR, _DEFAULT_ERROR_MESSAGES[HTTP_INTERNAL_SERVER_ERROR]))
+    return {
+        (status_code, message): orjson.dumps({'error': message}) + b'\n'
+        for status_code, message in messages
+    }
+
+
+_DEFAULT_ERROR_BODIES = _stock_error_bodies()
+
+def _error_response(error_message: str, status_code: int) -> Tuple[Response, int]:
+    """
+    Build an {"error": message} JSON response.
+    
+    Stock messages reuse their pre-serialized body; a new Response is still
+    created each time since after_request hooks (e.g. CORS) modify headers.
+    
+    Args:
+        error_message: Error message for the response body
+        status_code: HTTP status code
+    
+    Returns:
+        Tuple of (response, status_code)
+    """
+    body = _DEFAULT_ERROR_BODIES.get((status_code, error_message))
+    if body is None:
+        return jsonify({'error': error_message}), status_code
+    return Response(body, mimetype='application/json'), status_code
+
 
 def register_error_handlers(app: Flask) -> None:
     """
@@ -27,57 +87,65 @@ def register_error_handlers(app: Flask) -> None:
     @app.errorhandler(APIException)
     def handle_api_exception(error: APIException) -> Tuple[Response, int]:
         """Handle custom API exceptions."""
-        logger.warning(
-            f"API exception: {error.message}",
-            extra={'status_code': error.status_code, 'details': error.details}
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "API exception: %s",
+                error.message,
+                extra={'status_code': error.status_code, 'details': error.details}
+            )
         return jsonify(error.to_dict()), error.status_code
     
     @app.errorhandler(HTTP_BAD_REQUEST)
     def bad_request(error: Exception) -> Tuple[Response, int]:
         """Handle 400 Bad Request errors."""
-        error_message = str(error) if str(error) else 'Bad request'
-        logger.warning(f"Bad request: {error_message}")
-        return jsonify({'error': error_message}), HTTP_BAD_REQUEST
+        error_message = str(error) or _DEFAULT_ERROR_MESSAGES[HTTP_BAD_REQUEST]
+        logger.warning("Bad request: %s", error_message)
+        return _error_response(error_message, HTTP_BAD_REQUEST)
     
     @app.errorhandler(HTTP_NOT_FOUND)
     def not_found(error: Exception) -> Tuple[Response, int]:
         """Handle 404 Not Found errors."""
-        error_message = str(error) if str(error) else 'Not found'
-        logger.info(f"Not found: {error_message}")
-        return jsonify({'error': error_message}), HTTP_NOT_FOUND
+        error_message = str(error) or _DEFAULT_ERROR_MESSAGES[HTTP_NOT_FOUND]
+        logger.info("Not found: %s", error_message)
+        return _error_response(error_message, HTTP_NOT_FOUND)
     
     @app.errorhandler(HTTP_INTERNAL_SERVER_ERROR)
     def internal_error(error: Exception) -> Tuple[Response, int]:
         """Handle 500 Internal Server Error."""
-        logger.error(f"Internal server error: {str(error)}", exc_info=True)
-        return jsonify({'error': 'Internal server error'}), HTTP_INTERNAL_SERVER_ERROR
+        logger.error("Internal server error: %s", error, exc_info=True)
+        return _error_response(_DEFAULT_ERROR_MESSAGES[HTTP_INTERNAL_SERVER_ERROR], HTTP_INTERNAL_SERVER_ERROR)
     
     @app.errorhandler(HTTP_UNAUTHORIZED)
     def unauthorized(error: Exception) -> Tuple[Response, int]:
         """Handle 401 Unauthorized errors."""
-        error_message = str(error) if str(error) else 'Unauthorized'
-        logger.warning(f"Unauthorized: {error_message}")
-        return jsonify({'error': error_message}), HTTP_UNAUTHORIZED
+        error_message = str(error) or _DEFAULT_ERROR_MESSAGES[HTTP_UNAUTHORIZED]
+        logger.warning("Unauthorized: %s", error_message)
+        return _error_response(error_message, HTTP_UNAUTHORIZED)
     
     @app.errorhandler(HTTP_FORBIDDEN)
     def forbidden(error: Exception) -> Tuple[Response, int]:
         """Handle 403 Forbidden errors."""
-        error_message = str(error) if str(error) else 'Forbidden'
-        logger.warning(f"Forbidden: {error_message}")
-        return jsonify({'error': error_message}), HTTP_FORBIDDEN
+        error_message = str(error) or _DEFAULT_ERROR_MESSAGES[HTTP_FORBIDDEN]
+        logger.warning("Forbidden: %s", error_message)
+        return _error_response(error_message, HTTP_FORBIDDEN)
+    
+    @app.errorhandler(HTTP_PAYLOAD_TOO_LARGE)
+    def payload_too_large(error: Exception) -> Tuple[Response, int]:
+        """Handle 413 Payload Too Large errors (body over MAX_CONTENT_LENGTH)."""
+        error_message = str(error) or _DEFAULT_ERROR_MESSAGES[HTTP_PAYLOAD_TOO_LARGE]
+        logger.warning("Payload too large: %s", error_message)
+        return _error_response(error_message, HTTP_PAYLOAD_TOO_LARGE)
     
     @app.errorhandler(HTTP_UNPROCESSABLE_ENTITY)
     def unprocessable_entity(error: Exception) -> Tuple[Response, int]:
         """Handle 422 Unprocessable Entity errors."""
-        error_message = str(error) if str(error) else 'Unprocessable entity'
-        logger.warning(f"Unprocessable entity: {error_message}")
-        return jsonify({'error': error_message}), HTTP_UNPROCESSABLE_ENTITY
+        error_message = str(error) or _DEFAULT_ERROR_MESSAGES[HTTP_UNPROCESSABLE_ENTITY]
+        logger.warning("Unprocessable entity: %s", error_message)
+        return _error_response(error_message, HTTP_UNPROCESSABLE_ENTITY)
     
     @app.errorhandler(HTTP_TOO_MANY_REQUESTS)
     def too_many_requests(error: Exception) -> Tuple[Response, int]:
         """Handle 429 Too Many Requests errors."""
-        error_message = str(error) if str(error) else 'Too many requests'
-        logger.warning(f"Too many requests: {error_message}")
-        return jsonify({'error': error_message}), HTTP_TOO_MANY_REQUESTS
-
+        error_message = str(error) or _DEFAULT_ERROR_MESSAGES[HTTP_TOO_MANY_REQUESTS]
+        logger.warning("Too many requests: %s", error_message)
+        return _error_response(error_message, HTTP_TOO_MANY_REQUESTS)
@@ -1,4 +1,5 @@
 """Custom exception classes for the temperature monitoring system."""
+from typing import Optional
 from constants import (
     HTTP_BAD_REQUEST,
     HTTP_NOT_FOUND,
@@ -12,26 +13,25 @@ from constants import (
 class APIException(Exception):
     """Base exception class for API errors."""
     
-    def __init__(self, message: str, status_code: int = HTTP_BAD_REQUEST, details: dict = None):
+    def __init__(self, message: str, status_code: int = HTTP_BAD_REQUEST, details: Optional[dict] = None):
         """
         Initialize API exception.
         
         Args:
             message: Error message
             status_code: HTTP status code
-            details: Additional error details
+            details: Additional error details (None when there are none)
         """
         super().__init__(message)
         self.message = message
         self.status_code = status_code
-        self.details = details or {}
+        self.details = details
     
     def to_dict(self) -> dict:
         """Convert exception to dictionary for JSON response."""
-        result = {'error': self.message}
-        if self.details:
-            result['details'] = self.details
-        return result
+        if not self.details:
+            return {'error': self.message}
+        return {'error': self.message, 'details': self.details}
 
 
 class ValidationError(APIException):
@@ -125,8 +125,6 @@ class RateLimitError(APIException):
             message: Error message
             retry_after: Seconds until retry is allowed
         """
-        details = {}
-        if retry_after is not None:
-            details['retry_after'] = retry_after
+        details = {'retry_after': retry_after} if retry_after is not None else None
         super().__init__(message, status_code=HTTP_TOO_MANY_REQUESTS, details=details)
 
@@ -13,6 +13,7 @@ from errors import register_error_handlers
 from config import get_config
 from utils.logging_config import setup_logging
 from utils.middleware import request_logging_middleware
+from utils.json_provider import OrjsonProvider
 
 # Set up logging first
 setup_logging()
@@ -26,8 +27,20 @@ app: Flask = Flask(__name__)
 # Load configuration
 app.config.from_object(Config)
 
-# Enable CORS for frontend integration
-CORS(app)
+# Parse and serialize JSON with orjson (jsonify, request.json)
+app.json = OrjsonProvider(app)
+app.json.sort_keys = Config.JSON_SORT_KEYS
+app.json.compact = not Config.JSONIFY_PRETTYPRINT_REGULAR
+
+# Match routes with or without a trailing slash instead of redirecting
+# (must be set before blueprints add their rules)
+app.url_map.strict_slashes = False
+
+# Enable CORS for frontend integration. In production Nginx serves the frontend
+# and proxies /api on the same origin (and owns any CORS headers), so skip the
+# per-request flask-cors hook there
+if Config.ENV != 'production':
+    CORS(app)
 
 # Add request/response logging middleware
 request_logging_middleware(app)
@@ -42,14 +55,13 @@ app.register_blueprint(arduino_bp)
 register_error_handlers(app)
 
 # Load CSV data into memory on startup
-# This happens when ReadingService is initialized, which creates ReadingStorage
-# ReadingStorage loads data in its __init__ method
-from services.reading_service import ReadingService
-from storage.reading_storage import ReadingStorage
+# ReadingStorage loads data in its __init__ method; get_reading_storage() keeps a
+# single instance per process, shared with ReadingService
+from services.reading_service import get_reading_storage
 logger = logging.getLogger(__name__)
 try:
     # Initialize storage to load CSV data
-    storage = ReadingStorage()
+    storage = get_reading_storage()
     logger.info(f"CSV data loaded on startup: {len(storage._readings_cache)} readings in memory")
 except Exception as e:
     logger.error(f"Failed to load CSV data on startup: {e}", exc_info=True)
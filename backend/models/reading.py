@@ -1,12 +1,15 @@
 """Temperature reading data model."""
 from dataclasses import dataclass
 from typing import Optional
-from datetime import datetime
+from utils.timezone_utils import utc_now_iso
 
 
 @dataclass
 class Reading:
     """Temperature reading model."""
+    # No per-instance __dict__; the readings cache can hold many of these
+    __slots__ = ('tempC', 'recordedAt')
+    
     tempC: float
     recordedAt: str
     
@@ -30,8 +33,7 @@ class Reading:
     @classmethod
     def create_now(cls, tempC: float) -> 'Reading':
         """Create a reading with current timestamp."""
-        from datetime import datetime, timezone
-        timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        timestamp = utc_now_iso()
         return cls(
             tempC=tempC,
             recordedAt=timestamp
@@ -6,6 +6,8 @@ from typing import Optional
 @dataclass
 class User:
     """User model representing a system user."""
+    __slots__ = ('username', 'password')
+    
     username: str
     password: str  # Hashed password
     
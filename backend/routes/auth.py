@@ -1,14 +1,18 @@
 """Authentication routes."""
+import hmac
 from typing import Tuple, Any
 from flask import Blueprint, jsonify, request, abort, Response, g
-from services.user_service import UserService
+from services.user_service import UserService, CREDENTIALS_OK
 from services.jwt_service import jwt_service
 from services.token_storage import token_storage
-from utils.validators import validate_username, validate_password
-from utils.rate_limiter import rate_limiter
-from utils.auth_middleware import require_refresh_token
-from exceptions import ValidationError, AuthenticationError, NotFoundError, RateLimitError
+from utils.validators import validate_username, validate_password, required_field_response
+from utils.rate_limiter import rate_limiter, reset_key_rate_limiter, get_client_ip
+from utils.auth_middleware import require_refresh_token, extract_token_from_header
+from exceptions import ValidationError, AuthenticationError, RateLimitError
 from constants import HTTP_BAD_REQUEST, HTTP_CREATED, HTTP_OK
+from config import get_config
+
+Config = get_config()
 
 # Create a Blueprint for auth routes
 auth_bp = Blueprint('auth', __name__)
@@ -29,7 +33,7 @@ def signup() -> Tuple[Response, int]:
     if not request.is_json:
         abort(HTTP_BAD_REQUEST)  # Returns standard error response {'error': 'Bad request'} from error handler
     
-    ip_address = request.remote_addr or 'unknown'
+    ip_address = get_client_ip(request)
     
     # Check rate limit
     is_allowed, error_msg, retry_after = rate_limiter.check_rate_limit(ip_address)
@@ -44,12 +48,16 @@ def signup() -> Tuple[Response, int]:
     is_valid_username, username_error = validate_username(username)
     if not is_valid_username:
         rate_limiter.record_failed_attempt(ip_address)
+        if not username:
+            return required_field_response('username')
         raise ValidationError(username_error, field='username')
 
     # Validate password
     is_valid_password, password_error = validate_password(password)
     if not is_valid_password:
         rate_limiter.record_failed_attempt(ip_address)
+        if not password:
+            return required_field_response('password')
         raise ValidationError(password_error, field='password')
 
     try:
@@ -85,7 +93,7 @@ def login() -> Tuple[Response, int]:
     if not request.is_json:
         abort(HTTP_BAD_REQUEST)
     
-    ip_address = request.remote_addr or 'unknown'
+    ip_address = get_client_ip(request)
     data: dict[str, Any] = request.json or {}
     username: str = data.get('username', '')
     password: str = data.get('password', '')
@@ -99,23 +107,26 @@ def login() -> Tuple[Response, int]:
     is_valid_username, username_error = validate_username(username)
     if not is_valid_username:
         rate_limiter.record_failed_attempt(ip_address, username)
+        if not username:
+            return required_field_response('username')
         raise ValidationError(username_error, field='username')
 
     # Validate password
     is_valid_password, password_error = validate_password(password)
     if not is_valid_password:
         rate_limiter.record_failed_attempt(ip_address, username)
+        if not password:
+            return required_field_response('password')
         raise ValidationError(password_error, field='password')
 
-    # Check if user exists
-    if not user_service.user_exists(username):
-        rate_limiter.record_failed_attempt(ip_address, username)
-        raise NotFoundError('User', identifier=username)
+    # One lookup checks both; bcrypt runs (against a dummy hash for unknown
+    # users) either way, and both failures get the same response so neither
+    # the status code nor the timing reveals whether the username exists
+    credentials = user_service.verify_credentials(username, password)
 
-    # Verify password
-    if not user_service.verify_password(username, password):
+    if credentials != CREDENTIALS_OK:
         rate_limiter.record_failed_attempt(ip_address, username)
-        raise AuthenticationError('Invalid password')
+        raise AuthenticationError('Invalid username or password')
     
     # Reset rate limit on successful login
     rate_limiter.reset_attempts(ip_address, username)
@@ -148,21 +159,26 @@ def reset_rate_limit() -> Tuple[Response, int]:
     Returns:
         JSON response with status code
     """
-    from config import get_config
-    Config = get_config()
-    
-    ip_address = request.remote_addr or 'unknown'
-    data: dict[str, Any] = request.json or {} if request.is_json else {}
+    ip_address = get_client_ip(request)
+    data: dict[str, Any] = request.get_json(silent=True) or {}
     reset_key = data.get('reset_key')
     username = data.get('username')
     
     # Check if requesting to reset all (requires reset key)
-    if reset_key and reset_key == Config.RATE_LIMIT_RESET_KEY:
-        count = rate_limiter.reset_all()
-        return jsonify({
-            'message': f'All rate limits reset',
-            'reset_count': count
-        }), HTTP_OK
+    if reset_key:
+        # Wrong keys are counted per IP so the key cannot be brute-forced
+        is_allowed, error_msg, retry_after = reset_key_rate_limiter.check_rate_limit(ip_address)
+        if not is_allowed:
+            raise RateLimitError(error_msg, retry_after=retry_after)
+        
+        # Constant-time comparison so response timing does not leak the key
+        if hmac.compare_digest(str(reset_key).encode('utf-8'), Config.RATE_LIMIT_RESET_KEY.encode('utf-8')):
+            count = rate_limiter.reset_all()
+            return jsonify({
+                'message': f'All rate limits reset',
+                'reset_count': count
+            }), HTTP_OK
+        reset_key_rate_limiter.record_failed_attempt(ip_address)
     
     # Reset for specific IP/username
     if username:
@@ -230,15 +246,14 @@ def logout() -> Tuple[Response, int]:
     Returns:
         JSON response with status code
     """
-    from utils.auth_middleware import extract_token_from_header
-    
     # Try to get token, but don't require auth (logout should be idempotent)
     access_token = extract_token_from_header()
     
-    if access_token:
+    # Already-revoked tokens are a set lookup away; skip signature verification for them
+    if access_token and not token_storage.is_token_blacklisted(access_token):
         # Verify token to get username
         payload = jwt_service.verify_token(access_token)
-        if payload and not token_storage.is_token_blacklisted(access_token):
+        if payload:
             username = payload.get('username')
             token_type = payload.get('type')
             
@@ -246,7 +261,7 @@ def logout() -> Tuple[Response, int]:
                 # Blacklist current access token
                 token_storage.blacklist_token(access_token)
                 
-                data: dict[str, Any] = request.json or {} if request.is_json else {}
+                data: dict[str, Any] = request.get_json(silent=True) or {}
                 revoke_all = data.get('revoke_all', False)
                 
                 # Revoke refresh token or all tokens
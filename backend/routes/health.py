@@ -1,6 +1,7 @@
 """Health and status routes."""
 from typing import Tuple
-from flask import Blueprint, jsonify, Response
+import orjson
+from flask import Blueprint, Response
 from config import get_config
 from constants import HTTP_OK
 
@@ -10,6 +11,14 @@ Config = get_config()
 # Create a Blueprint for health routes
 health_bp = Blueprint('health', __name__)
 
+# Health payloads never change at runtime, so serialize them once at import
+_INDEX_BODY = orjson.dumps({
+    'status': 'ok',
+    'message': 'Temperature Monitor API',
+    'version': Config.APP_VERSION
+}) + b'\n'
+_HEALTH_BODY = orjson.dumps({'status': 'healthy'}) + b'\n'
+
 
 @health_bp.route('/')
 def index() -> Tuple[Response, int]:
@@ -19,11 +28,8 @@ def index() -> Tuple[Response, int]:
     Returns:
         JSON response with API status and version, and HTTP status code
     """
-    return jsonify({
-        'status': 'ok',
-        'message': 'Temperature Monitor API',
-        'version': Config.APP_VERSION
-    }), HTTP_OK
+    # Fresh Response per request (after_request hooks modify headers); the body is shared
+    return Response(_INDEX_BODY, mimetype='application/json'), HTTP_OK
 
 
 @health_bp.route('/api/health')
@@ -34,5 +40,4 @@ def health() -> Tuple[Response, int]:
     Returns:
         JSON response with health status and HTTP status code
     """
-    return jsonify({'status': 'healthy'}), HTTP_OK
-
+    return Response(_HEALTH_BODY, mimetype='application/json'), HTTP_OK
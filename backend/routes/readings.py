@@ -1,10 +1,11 @@
 """Temperature reading routes."""
 import logging
-from typing import Tuple, Optional, Dict, Any
-from flask import Blueprint, jsonify, request, Response
-from services.reading_service import ReadingService
+from typing import Tuple, Optional, Dict, Any, Iterator, List
+from flask import Blueprint, request, Response, current_app, stream_with_context
+from models.reading import Reading
+from services.reading_service import get_reading_service
 from utils.auth_middleware import require_auth
-from utils.timezone_utils import convert_utc_to_toronto
+from utils.timezone_utils import utc_to_toronto_datetime
 from constants import HTTP_OK
 
 logger = logging.getLogger(__name__)
@@ -12,8 +13,38 @@ logger = logging.getLogger(__name__)
 # Create a Blueprint for readings routes
 readings_bp = Blueprint('readings', __name__)
 
-# Initialize reading service
-reading_service = ReadingService()
+
+def _reading_to_toronto_dict(reading: Reading) -> Dict[str, Any]:
+    """
+    Convert a reading to a dictionary with recordedAt in Toronto time.
+    
+    recordedAt is left as an aware datetime; the app's orjson provider
+    serializes it to the same ISO 8601 string isoformat() would.
+    """
+    reading_dict = reading.to_dict()
+    try:
+        reading_dict['recordedAt'] = utc_to_toronto_datetime(reading_dict['recordedAt'])
+    except ValueError as e:
+        logger.warning("Failed to convert timestamp to Toronto time: %s, keeping original", e)
+        # Keep original timestamp if conversion fails
+    return reading_dict
+
+
+def _stream_readings_json(readings: List[Reading]) -> Iterator[str]:
+    """
+    Serialize the readings response one reading at a time.
+    
+    Avoids materializing the full list of dictionaries and the complete JSON
+    document in memory for large date ranges.
+    """
+    dumps = current_app.json.dumps
+    to_dict = _reading_to_toronto_dict
+    yield f'{{"message":"Readings retrieved","count":{len(readings)},"readings":['
+    separator = ''
+    for reading in readings:
+        yield separator + dumps(to_dict(reading))
+        separator = ','
+    yield ']}'
 
 
 @readings_bp.route('/api/readings', methods=['GET'])
@@ -43,31 +74,20 @@ def get_readings() -> Tuple[Response, int]:
     end_datetime_str: Optional[str] = request.args.get('endDateTime')
     
     logger.info(
-        f"Retrieving readings - startDateTime: {start_datetime_str}, endDateTime: {end_datetime_str}"
+        "Retrieving readings - startDateTime: %s, endDateTime: %s",
+        start_datetime_str,
+        end_datetime_str
     )
     
     # Get readings from service (handles timezone conversion and filtering)
     # Both startDateTime and endDateTime are required
-    readings = reading_service.get_readings(start_datetime_str or '', end_datetime_str or '')
-    
-    # Convert to dictionary format and convert UTC timestamps to Toronto time
-    readings_data: list[Dict[str, Any]] = []
-    for reading in readings:
-        reading_dict = reading.to_dict()
-        # Convert recordedAt from UTC to Toronto time
-        try:
-            reading_dict['recordedAt'] = convert_utc_to_toronto(reading_dict['recordedAt'])
-        except ValueError as e:
-            logger.warning(f"Failed to convert timestamp to Toronto time: {e}, keeping original")
-            # Keep original timestamp if conversion fails
-        
-        readings_data.append(reading_dict)
+    readings = get_reading_service().get_readings(start_datetime_str or '', end_datetime_str or '')
     
-    logger.info(f"Returning {len(readings_data)} readings")
+    logger.info("Returning %d readings", len(readings))
     
-    return jsonify({
-        'message': 'Readings retrieved',
-        'count': len(readings_data),
-        'readings': readings_data
-    }), HTTP_OK
+    # Stream the response, converting UTC timestamps to Toronto time per reading
+    return Response(
+        stream_with_context(_stream_readings_json(readings)),
+        mimetype='application/json'
+    ), HTTP_OK
 
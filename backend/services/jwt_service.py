@@ -1,6 +1,9 @@
 """JWT service for token generation and validation."""
 import jwt
 import logging
+import time
+from collections import OrderedDict
+from threading import Lock
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from config import get_config
@@ -8,6 +11,9 @@ from config import get_config
 Config = get_config()
 logger = logging.getLogger(__name__)
 
+# Maximum number of verified token payloads kept in the verification cache
+VERIFY_CACHE_MAX_SIZE = 1024
+
 
 class JWTService:
     """Service for JWT token operations."""
@@ -18,6 +24,12 @@ class JWTService:
         self.algorithm = Config.JWT_ALGORITHM
         self.access_token_expires_in = Config.JWT_ACCESS_TOKEN_EXPIRES_IN
         self.refresh_token_expires_in = Config.JWT_REFRESH_TOKEN_EXPIRES_IN
+        self._access_token_lifetime = timedelta(seconds=self.access_token_expires_in)
+        self._refresh_token_lifetime = timedelta(seconds=self.refresh_token_expires_in)
+        # LRU cache of verified payloads: {token: payload}. A token's signature
+        # never changes, so only its expiry needs re-checking on a hit.
+        self._verify_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._verify_cache_lock = Lock()
     
     def generate_access_token(self, username: str) -> str:
         """
@@ -29,11 +41,12 @@ class JWTService:
         Returns:
             JWT access token string
         """
+        now = datetime.now(timezone.utc)
         payload = {
             'username': username,
             'type': 'access',
-            'exp': datetime.now(timezone.utc) + timedelta(seconds=self.access_token_expires_in),
-            'iat': datetime.now(timezone.utc)
+            'exp': now + self._access_token_lifetime,
+            'iat': now
         }
         
         token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
@@ -50,11 +63,12 @@ class JWTService:
         Returns:
             JWT refresh token string
         """
+        now = datetime.now(timezone.utc)
         payload = {
             'username': username,
             'type': 'refresh',
-            'exp': datetime.now(timezone.utc) + timedelta(seconds=self.refresh_token_expires_in),
-            'iat': datetime.now(timezone.utc)
+            'exp': now + self._refresh_token_lifetime,
+            'iat': now
         }
         
         token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
@@ -65,12 +79,25 @@ class JWTService:
         """
         Verify and decode a JWT token.
         
+        Repeat verifications of the same token are served from an LRU cache;
+        the cached payload's exp is still checked on every call.
+        
         Args:
             token: JWT token string
             
         Returns:
             Decoded token payload if valid, None otherwise
         """
+        with self._verify_cache_lock:
+            payload = self._verify_cache.get(token)
+            if payload is not None:
+                if payload['exp'] > time.time():
+                    self._verify_cache.move_to_end(token)
+                    return dict(payload)
+                del self._verify_cache[token]
+                logger.warning("Token expired")
+                return None
+        
         try:
             payload = jwt.decode(
                 token,
@@ -78,13 +105,20 @@ class JWTService:
                 algorithms=[self.algorithm],
                 options={'verify_exp': True, 'verify_signature': True}
             )
-            return payload
         except jwt.ExpiredSignatureError:
             logger.warning("Token expired")
             return None
         except jwt.InvalidTokenError as e:
             logger.warning(f"Invalid token: {e}")
             return None
+        
+        # Tokens issued here always carry exp; anything else is not cached
+        if isinstance(payload.get('exp'), (int, float)):
+            with self._verify_cache_lock:
+                self._verify_cache[token] = dict(payload)
+                if len(self._verify_cache) > VERIFY_CACHE_MAX_SIZE:
+                    self._verify_cache.popitem(last=False)
+        return payload
     
     def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
         """
@@ -1,18 +1,59 @@
 """Reading service for handling temperature reading business logic."""
 import logging
 from typing import List, Optional, Dict
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from datetime import datetime, timezone
 from collections import defaultdict
 from models.reading import Reading
 from storage.reading_storage import ReadingStorage
 from exceptions import ValidationError
-
-UTC_TZ = ZoneInfo('UTC')
+from utils.timezone_utils import parse_utc_iso
 
 logger = logging.getLogger(__name__)
 
 
+def _utc_minute_key(recorded_at: str) -> str:
+    """
+    Get the UTC minute bucket ('YYYY-MM-DDTHH:MM') for a stored timestamp.
+    
+    Timestamps written by serial ingest are already canonical UTC
+    (e.g. "2025-11-04T10:15:42.123456Z"), so their minute prefix is sliced
+    directly. Anything else is parsed and normalized to UTC.
+    
+    Args:
+        recorded_at: ISO format timestamp string
+        
+    Returns:
+        Minute bucket string in UTC
+    """
+    if (
+        recorded_at.endswith('Z')
+        and len(recorded_at) >= 20
+        and recorded_at[10] == 'T'
+        and recorded_at[16] == ':'
+    ):
+        return recorded_at[:16]
+    recorded_at_utc = parse_utc_iso(recorded_at)
+    # Naive and +00:00 values are already UTC; only real offsets need converting
+    if recorded_at_utc.utcoffset():
+        recorded_at_utc = recorded_at_utc.astimezone(timezone.utc)
+    return recorded_at_utc.isoformat(timespec='minutes')[:16]
+
+
+def _minute_average(minute_key: str, total: float, count: int) -> Reading:
+    """
+    Build the averaged Reading for one minute bucket.
+    
+    Args:
+        minute_key: Minute bucket string in UTC ('YYYY-MM-DDTHH:MM')
+        total: Sum of the minute's temperatures
+        count: Number of readings in the minute
+        
+    Returns:
+        Reading stamped at the start of the minute (UTC), rounded to 2 decimal places
+    """
+    return Reading(tempC=round(total / count, 2), recordedAt=f"{minute_key}:00Z")
+
+
 class ReadingService:
     """Service for temperature reading operations."""
     
@@ -21,9 +62,9 @@ class ReadingService:
         Initialize reading service with storage.
         
         Args:
-            storage: ReadingStorage instance. If None, creates a new one.
+            storage: ReadingStorage instance. If None, uses the shared instance.
         """
-        self.storage = storage or ReadingStorage()
+        self.storage = storage or get_reading_storage()
     
     def get_readings(
         self,
@@ -54,39 +95,31 @@ class ReadingService:
         
         # Parse UTC datetime strings
         try:
-            # Handle 'Z' suffix or +00:00
-            start_str = start_datetime_utc_str.replace('Z', '+00:00')
-            start_datetime_utc = datetime.fromisoformat(start_str)
-            if start_datetime_utc.tzinfo is None:
-                start_datetime_utc = start_datetime_utc.replace(tzinfo=UTC_TZ)
-            logger.debug(f"Parsed start datetime UTC: {start_datetime_utc}")
+            start_datetime_utc = parse_utc_iso(start_datetime_utc_str)
+            logger.debug("Parsed start datetime UTC: %s", start_datetime_utc)
         except ValueError as e:
-            logger.error(f"Invalid startDateTime format: {start_datetime_utc_str}")
+            logger.error("Invalid startDateTime format: %s", start_datetime_utc_str)
             raise ValidationError(f'Invalid startDateTime format: {e}', field='startDateTime') from e
         
         try:
-            # Handle 'Z' suffix or +00:00
-            end_str = end_datetime_utc_str.replace('Z', '+00:00')
-            end_datetime_utc = datetime.fromisoformat(end_str)
-            if end_datetime_utc.tzinfo is None:
-                end_datetime_utc = end_datetime_utc.replace(tzinfo=UTC_TZ)
-            logger.debug(f"Parsed end datetime UTC: {end_datetime_utc}")
+            end_datetime_utc = parse_utc_iso(end_datetime_utc_str)
+            logger.debug("Parsed end datetime UTC: %s", end_datetime_utc)
         except ValueError as e:
-            logger.error(f"Invalid endDateTime format: {end_datetime_utc_str}")
+            logger.error("Invalid endDateTime format: %s", end_datetime_utc_str)
             raise ValidationError(f'Invalid endDateTime format: {e}', field='endDateTime') from e
         
         # Validate date range
         if start_datetime_utc > end_datetime_utc:
-            logger.warning(f"Start datetime is after end datetime: {start_datetime_utc} > {end_datetime_utc}")
+            logger.warning("Start datetime is after end datetime: %s > %s", start_datetime_utc, end_datetime_utc)
             raise ValidationError('startDateTime must be before or equal to endDateTime', field='startDateTime')
         
         # Get filtered readings from in-memory storage
         raw_readings = self.storage.read_readings(start_datetime_utc, end_datetime_utc)
-        logger.info(f"Retrieved {len(raw_readings)} raw readings")
+        logger.info("Retrieved %d raw readings", len(raw_readings))
         
         # Group readings by minute and calculate averages
         averaged_readings = self._average_by_minute(raw_readings)
-        logger.info(f"Averaged to {len(averaged_readings)} readings (one per minute)")
+        logger.info("Averaged to %d readings (one per minute)", len(averaged_readings))
         
         return averaged_readings
     
@@ -94,48 +127,83 @@ class ReadingService:
         """
         Group readings by minute and calculate average temperature for each minute.
         
+        Storage returns readings in time order, so minutes are averaged in one
+        pass with running sums; out-of-order input falls back to grouping.
+        
         Args:
             readings: List of Reading objects
             
         Returns:
             List of Reading objects with averaged temperatures, one per minute
         """
-        if not readings:
-            return []
-        
-        # Group readings by minute (truncate seconds and microseconds)
-        minute_groups: Dict[datetime, List[float]] = defaultdict(list)
+        averaged_readings: List[Reading] = []
+        current_key: Optional[str] = None
+        total = 0.0
+        count = 0
         
         for reading in readings:
-            # Parse the UTC datetime from the reading
-            recorded_at_str = reading.recordedAt.replace('Z', '+00:00')
-            recorded_at_utc = datetime.fromisoformat(recorded_at_str)
-            
-            # Ensure timezone is set to UTC
-            if recorded_at_utc.tzinfo is None:
-                recorded_at_utc = recorded_at_utc.replace(tzinfo=UTC_TZ)
-            
-            # Truncate to minute (remove seconds and microseconds)
-            minute_key = recorded_at_utc.replace(second=0, microsecond=0)
-            
-            # Add temperature to the group for this minute
-            minute_groups[minute_key].append(reading.tempC)
+            # Bucket by UTC minute (truncate seconds and microseconds)
+            minute_key = _utc_minute_key(reading.recordedAt)
+            if minute_key != current_key:
+                if current_key is not None:
+                    if minute_key < current_key:
+                        # Minute keys share one fixed-width format, so this means unsorted input
+                        return self._average_by_minute_unsorted(readings)
+                    averaged_readings.append(_minute_average(current_key, total, count))
+                current_key = minute_key
+                total = 0.0
+                count = 0
+            total += reading.tempC
+            count += 1
         
-        # Calculate average for each minute and create Reading objects
-        averaged_readings: List[Reading] = []
-        for minute_dt, temperatures in sorted(minute_groups.items()):
-            # Calculate average temperature
-            avg_temp = sum(temperatures) / len(temperatures)
-            
-            # Create ISO format timestamp for this minute (UTC)
-            minute_iso = minute_dt.isoformat().replace('+00:00', 'Z')
-            
-            # Create Reading object with averaged temperature
-            averaged_reading = Reading(
-                tempC=round(avg_temp, 2),  # Round to 2 decimal places
-                recordedAt=minute_iso
-            )
-            averaged_readings.append(averaged_reading)
+        if current_key is not None:
+            averaged_readings.append(_minute_average(current_key, total, count))
         
         return averaged_readings
+    
+    def _average_by_minute_unsorted(self, readings: List[Reading]) -> List[Reading]:
+        """
+        Average readings per minute when they are not in time order.
+        
+        Args:
+            readings: List of Reading objects
+            
+        Returns:
+            List of Reading objects with averaged temperatures, one per minute
+        """
+        # Running totals per UTC minute (truncate seconds and microseconds),
+        # accumulated the same way as the sorted single pass
+        totals: Dict[str, float] = defaultdict(float)
+        counts: Dict[str, int] = defaultdict(int)
+        
+        for reading in readings:
+            minute_key = _utc_minute_key(reading.recordedAt)
+            totals[minute_key] += reading.tempC
+            counts[minute_key] += 1
+        
+        # Minute keys share one fixed-width format, so they sort chronologically
+        return [
+            _minute_average(minute_key, totals[minute_key], counts[minute_key])
+            for minute_key in sorted(totals)
+        ]
+
+
+# Global instances
+_reading_storage: Optional[ReadingStorage] = None
+_reading_service: Optional[ReadingService] = None
+
+
+def get_reading_storage() -> ReadingStorage:
+    """Get the global ReadingStorage instance, so the CSV is loaded once per process."""
+    global _reading_storage
+    if _reading_storage is None:
+        _reading_storage = ReadingStorage()
+    return _reading_storage
+
 
+def get_reading_service() -> ReadingService:
+    """Get the global ReadingService instance, created on first use."""
+    global _reading_service
+    if _reading_service is None:
+        _reading_service = ReadingService()
+    return _reading_service
@@ -3,14 +3,19 @@ Shared serial port manager with command queue.
 Allows multiple processes to coordinate serial port access.
 """
 import logging
-import json
 import os
 import time
 from pathlib import Path
 from typing import Optional, Tuple, List
 from threading import Lock
+import orjson
 from config import get_config
 
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to the lock-file polling below
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 Config = get_config()
 
@@ -25,6 +30,7 @@ class SerialPortManager:
         self._command_queue_file = Config.STORAGE_DIR / 'arduino_commands.json'
         self._lock_file = Config.STORAGE_DIR / 'arduino_commands.lock'
         self._lock = Lock()
+        self._lock_fd: Optional[int] = None  # Open lock file descriptor for flock
         self._ensure_storage_dir()
     
     def _ensure_storage_dir(self):
@@ -34,8 +40,15 @@ class SerialPortManager:
     def _acquire_file_lock(self, timeout: float = 1.0) -> bool:
         """
         Acquire a file-based lock for cross-process coordination.
+        
+        Uses an OS-level flock on the lock file where available, so the lock is
+        atomic and released by the kernel if the holder dies; otherwise the lock
+        file's existence is the lock.
         Returns True if lock acquired, False otherwise.
         """
+        if fcntl is not None:
+            return self._acquire_flock(timeout)
+        
         start_time = time.time()
         while time.time() - start_time < timeout:
             try:
@@ -57,8 +70,34 @@ class SerialPortManager:
             time.sleep(0.1)
         return False
     
+    def _acquire_flock(self, timeout: float) -> bool:
+        """
+        Take an exclusive flock on the lock file, retrying until the timeout.
+        Returns True if lock acquired, False otherwise.
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            if self._lock_fd is None:
+                self._lock_fd = os.open(self._lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+            while True:
+                try:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return True
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        return False
+                    time.sleep(0.01)
+        except OSError as e:
+            logger.error(f"Error locking command queue: {e}")
+            return False
+    
     def _release_file_lock(self):
         """Release the file-based lock."""
+        if fcntl is not None:
+            if self._lock_fd is not None:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            return
+        
         try:
             if self._lock_file.exists():
                 self._lock_file.unlink()
@@ -133,6 +172,19 @@ class SerialPortManager:
         Args:
             command_timestamp: Timestamp of the command to mark as processed
         
+        Returns:
+            True if successfully marked, False otherwise
+        """
+        return self.mark_commands_processed([command_timestamp])
+    
+    def mark_commands_processed(self, command_timestamps: List[float]) -> bool:
+        """
+        Mark several commands as processed with one queue read/write.
+        Used by serial_ingest.py after sending a batch of commands.
+        
+        Args:
+            command_timestamps: Timestamps of the commands to mark as processed
+        
         Returns:
             True if successfully marked, False otherwise
         """
@@ -142,22 +194,27 @@ class SerialPortManager:
             
             try:
                 commands = self._read_command_queue()
+                processed_at = time.time()
                 
-                # Mark command as processed
+                # Mark commands as processed
                 for cmd in commands:
-                    if abs(cmd.get('timestamp', 0) - command_timestamp) < 0.001:
+                    if cmd.get('status') == 'pending' and any(
+                        abs(cmd.get('timestamp', 0) - command_timestamp) < 0.001
+                        for command_timestamp in command_timestamps
+                    ):
                         cmd['status'] = 'processed'
-                        cmd['processed_at'] = time.time()
-                        break
+                        cmd['processed_at'] = processed_at
                 
-                # Keep only last 100 commands (cleanup old ones)
-                commands = [cmd for cmd in commands if cmd.get('status') == 'processed']
-                commands = commands[-100:]
+                # Keep only last 100 processed commands (cleanup old ones); commands
+                # queued since the batch was read stay pending
+                processed = [cmd for cmd in commands if cmd.get('status') == 'processed']
+                pending = [cmd for cmd in commands if cmd.get('status') == 'pending']
+                commands = processed[-100:] + pending
                 
                 self._write_command_queue(commands)
                 return True
             except Exception as e:
-                logger.error(f"Error marking command as processed: {e}", exc_info=True)
+                logger.error(f"Error marking commands as processed: {e}", exc_info=True)
                 return False
             finally:
                 self._release_file_lock()
@@ -168,16 +225,16 @@ class SerialPortManager:
             return []
         
         try:
-            with open(self._command_queue_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(self._command_queue_file, 'rb') as f:
+                return orjson.loads(f.read())
+        except (orjson.JSONDecodeError, IOError):
             return []
     
     def _write_command_queue(self, commands: List[dict]):
         """Write command queue to file."""
         try:
-            with open(self._command_queue_file, 'w', encoding='utf-8') as f:
-                json.dump(commands, f, indent=2)
+            with open(self._command_queue_file, 'wb') as f:
+                f.write(orjson.dumps(commands))
         except IOError as e:
             logger.error(f"Error writing command queue: {e}")
             raise
@@ -1,21 +1,38 @@
 """Token storage for managing active refresh tokens and blacklisted tokens."""
 import logging
+from hashlib import blake2b
 from typing import Set, Optional
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
 
+def _token_fingerprint(token: str) -> bytes:
+    """
+    Get a fixed-size fingerprint of a token for storage.
+    
+    Only token identity is needed, so the 16-byte BLAKE2b digest is stored
+    instead of the full JWT string (typically several hundred bytes).
+    
+    Args:
+        token: Token string
+        
+    Returns:
+        128-bit digest of the token
+    """
+    return blake2b(token.encode('utf-8'), digest_size=16).digest()
+
+
 class TokenStorage:
     """Storage for managing JWT tokens."""
     
     def __init__(self):
         """Initialize token storage."""
-        # Active refresh tokens: {username: Set[refresh_token]}
-        self.active_refresh_tokens: defaultdict[str, Set[str]] = defaultdict(set)
+        # Active refresh tokens: {username: Set[refresh_token fingerprint]}
+        self.active_refresh_tokens: defaultdict[str, Set[bytes]] = defaultdict(set)
         
-        # Blacklisted tokens (access tokens and revoked refresh tokens)
-        self.blacklisted_tokens: Set[str] = set()
+        # Blacklisted token fingerprints (access tokens and revoked refresh tokens)
+        self.blacklisted_tokens: Set[bytes] = set()
     
     def add_refresh_token(self, username: str, refresh_token: str) -> None:
         """
@@ -25,7 +42,7 @@ class TokenStorage:
             username: Username
             refresh_token: Refresh token string
         """
-        self.active_refresh_tokens[username].add(refresh_token)
+        self.active_refresh_tokens[username].add(_token_fingerprint(refresh_token))
         logger.debug(f"Added refresh token for user: {username}")
     
     def is_refresh_token_active(self, username: str, refresh_token: str) -> bool:
@@ -39,7 +56,7 @@ class TokenStorage:
         Returns:
             True if token is active, False otherwise
         """
-        return refresh_token in self.active_refresh_tokens.get(username, set())
+        return _token_fingerprint(refresh_token) in self.active_refresh_tokens.get(username, set())
     
     def revoke_refresh_token(self, username: str, refresh_token: str) -> bool:
         """
@@ -53,10 +70,11 @@ class TokenStorage:
             True if token was revoked, False if not found
         """
         if username in self.active_refresh_tokens:
-            removed = self.active_refresh_tokens[username].discard(refresh_token)
-            if removed or refresh_token in self.active_refresh_tokens.get(username, set()):
+            fingerprint = _token_fingerprint(refresh_token)
+            removed = self.active_refresh_tokens[username].discard(fingerprint)
+            if removed or fingerprint in self.active_refresh_tokens.get(username, set()):
                 # Add to blacklist
-                self.blacklisted_tokens.add(refresh_token)
+                self.blacklisted_tokens.add(fingerprint)
                 logger.info(f"Revoked refresh token for user: {username}")
                 return True
         return False
@@ -92,7 +110,7 @@ class TokenStorage:
         Args:
             token: Token string to blacklist
         """
-        self.blacklisted_tokens.add(token)
+        self.blacklisted_tokens.add(_token_fingerprint(token))
         logger.debug("Token added to blacklist")
     
     def is_token_blacklisted(self, token: str) -> bool:
@@ -105,7 +123,7 @@ class TokenStorage:
         Returns:
             True if blacklisted, False otherwise
         """
-        return token in self.blacklisted_tokens
+        return _token_fingerprint(token) in self.blacklisted_tokens
     
     def cleanup_expired_tokens(self) -> None:
         """
@@ -1,9 +1,35 @@
 """User service for handling user business logic."""
+import os
 import bcrypt
+from collections import OrderedDict
+from threading import Lock
 from typing import Optional, Tuple
 from models.user import User
 from storage.file_storage import UserStorage
 from exceptions import ValidationError
+from config import get_config
+
+Config = get_config()
+
+# Maximum number of user records kept in each UserService's lookup cache
+USER_CACHE_MAX_SIZE = 1024
+
+# Results of UserService.verify_credentials
+CREDENTIALS_OK = 'ok'
+CREDENTIALS_USER_MISSING = 'user_missing'
+CREDENTIALS_PASSWORD_MISMATCH = 'password_mismatch'
+
+# bcrypt hash checked against when a user does not exist, so a login for an
+# unknown username costs the same bcrypt work as one with a wrong password
+_dummy_password_hash: Optional[bytes] = None
+
+
+def _get_dummy_password_hash() -> bytes:
+    """Get (creating on first use) the bcrypt hash used for unknown users."""
+    global _dummy_password_hash
+    if _dummy_password_hash is None:
+        _dummy_password_hash = bcrypt.hashpw(b'dummy-password', bcrypt.gensalt(rounds=Config.BCRYPT_ROUNDS))
+    return _dummy_password_hash
 
 
 class UserService:
@@ -12,6 +38,14 @@ class UserService:
     def __init__(self):
         """Initialize user service with storage."""
         self.storage = UserStorage()
+        self._users_file = Config.USERS_JSON_FILE
+        # LRU cache of user lookups: {username: user_data, or None if not found}.
+        # Misses are cached too: adding a user changes the users file, which
+        # clears the cache, so a new user is still found on the next lookup.
+        self._user_cache: 'OrderedDict[str, Optional[dict]]' = OrderedDict()
+        self._user_cache_lock = Lock()
+        # Users file signature the cache was filled from; any change clears it
+        self._users_file_signature: Optional[Tuple[int, int, int]] = None
     
     def get_user(self, username: str) -> Tuple[Optional[User], Optional[str]]:
         """
@@ -23,12 +57,67 @@ class UserService:
         Returns:
             Tuple of (User object, hashed_password) or (None, None) if not found
         """
-        user_data = self.storage.get_user_by_username(username)
+        user_data = self._lookup_user(username)
         if user_data:
             user = User.from_dict(user_data)
             return (user, user_data.get('password'))
         return (None, None)
     
+    def _lookup_user(self, username: str) -> Optional[dict]:
+        """
+        Look up a user record, serving repeat lookups (hits and misses) from
+        the LRU cache.
+        
+        The cache is dropped whenever the users file changes on disk, so a user
+        added, removed or re-hashed by another process or by editing the file
+        is seen right away; otherwise the file is not read or parsed again.
+        
+        Args:
+            username: Username to search for
+            
+        Returns:
+            User record dictionary, or None if not found
+        """
+        signature = self._get_users_file_signature()
+        with self._user_cache_lock:
+            if signature != self._users_file_signature:
+                self._user_cache.clear()
+                self._users_file_signature = signature
+            if username in self._user_cache:
+                self._user_cache.move_to_end(username)
+                return self._user_cache[username]
+        
+        user_data = self.storage.get_user_by_username(username) or None
+        self._cache_user(username, user_data)
+        return user_data
+    
+    def _get_users_file_signature(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Get the users file's (mtime_ns, size, inode), or None if it is missing.
+        
+        Size and inode catch rewrites and atomic replaces that land within the
+        filesystem's timestamp granularity.
+        """
+        try:
+            stat = os.stat(self._users_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    def _cache_user(self, username: str, user_data: Optional[dict]) -> None:
+        """
+        Add a lookup result to the LRU cache, evicting the oldest if full.
+        
+        Args:
+            username: Username
+            user_data: User record dictionary, or None if not found
+        """
+        with self._user_cache_lock:
+            self._user_cache[username] = user_data
+            self._user_cache.move_to_end(username)
+            if len(self._user_cache) > USER_CACHE_MAX_SIZE:
+                self._user_cache.popitem(last=False)
+    
     def user_exists(self, username: str) -> bool:
         """
         Check if a user exists.
@@ -59,12 +148,38 @@ class UserService:
         if self.user_exists(username):
             raise ValidationError("Username already exists", field='username')
         
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=Config.BCRYPT_ROUNDS)).decode('utf-8')
         user = User(username=username, password=hashed_password)
         
+        # The write changes the users file, so the next lookup reloads from it
         self.storage.add_user(username, hashed_password)
         return user
     
+    def verify_credentials(self, username: str, password: str) -> str:
+        """
+        Check a username and password with a single user lookup.
+        
+        bcrypt runs even when the user does not exist (against a dummy hash),
+        so both failure cases cost the same hashing work; the login route
+        answers both with the same 401.
+        
+        Args:
+            username: Username
+            password: Plain text password to verify
+            
+        Returns:
+            CREDENTIALS_OK, CREDENTIALS_USER_MISSING or CREDENTIALS_PASSWORD_MISMATCH
+        """
+        user_data = self._lookup_user(username)
+        hashed_password = user_data.get('password') if user_data else None
+        if hashed_password is None:
+            bcrypt.checkpw(password.encode('utf-8'), _get_dummy_password_hash())
+            return CREDENTIALS_USER_MISSING
+        
+        if bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8')):
+            return CREDENTIALS_OK
+        return CREDENTIALS_PASSWORD_MISMATCH
+    
     def verify_password(self, username: str, password: str) -> bool:
         """
         Verify user password.
@@ -76,9 +191,4 @@ class UserService:
         Returns:
             True if password is correct, False otherwise
         """
-        user, hashed_password = self.get_user(username)
-        if user is None or hashed_password is None:
-            return False
-        
-        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
-
+        return self.verify_credentials(username, password) == CREDENTIALS_OK
@@ -3,14 +3,53 @@ import pytest
 import os
 import tempfile
 import shutil
+import time
 from pathlib import Path
+
+# Use bcrypt's minimum work factor so password hashing doesn't dominate test time
+# (must be set before config is imported)
+os.environ.setdefault('BCRYPT_ROUNDS', '4')
+
 from flask import Flask
 from flask_cors import CORS
 from errors import register_error_handlers
 from config import get_config
 from services.token_storage import token_storage
 from services.jwt_service import jwt_service
-from utils.rate_limiter import rate_limiter
+from utils.rate_limiter import rate_limiter, reset_key_rate_limiter
+from utils.json_provider import OrjsonProvider
+
+
+class FakeClock:
+    """
+    Stand-in for a module's `time` import with a controllable time().
+    
+    Patching the module attribute (rather than time.time itself) keeps the
+    fake clock local to the module under test; every other time function is
+    passed through.
+    """
+    
+    def __init__(self, now: float, step: float = 0.0):
+        self.now = now
+        self.step = step
+    
+    def time(self) -> float:
+        value = self.now
+        self.now += self.step
+        return value
+    
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Install a FakeClock as a module's `time`: fake_clock(module, now=1000.0, step=0.0)."""
+    def _install(module, now: float = 1000.0, step: float = 0.0) -> FakeClock:
+        clock = FakeClock(now, step)
+        monkeypatch.setattr(module, 'time', clock)
+        return clock
+    return _install
 
 
 @pytest.fixture(scope='function')
@@ -63,11 +102,13 @@ def app(test_config):
     app = Flask(__name__)
     app.config['TESTING'] = True
     app.config['SECRET_KEY'] = 'test-secret-key'
+    app.json = OrjsonProvider(app)
     
     # Clear token storage and rate limiter (in-memory, reset between tests)
     token_storage.active_refresh_tokens.clear()
     token_storage.blacklisted_tokens.clear()
     rate_limiter.failed_attempts.clear()
+    reset_key_rate_limiter.failed_attempts.clear()
     
     # Register blueprints (use reloaded modules)
     app.register_blueprint(health_module.health_bp)
@@ -86,6 +127,7 @@ def app(test_config):
     token_storage.active_refresh_tokens.clear()
     token_storage.blacklisted_tokens.clear()
     rate_limiter.failed_attempts.clear()
+    reset_key_rate_limiter.failed_attempts.clear()
     
     # Cleanup: Remove all users from test storage
     try:
@@ -7,6 +7,7 @@ from constants import (
     HTTP_BAD_REQUEST,
     HTTP_UNAUTHORIZED,
     HTTP_NOT_FOUND,
+    HTTP_PAYLOAD_TOO_LARGE,
     HTTP_TOO_MANY_REQUESTS
 )
 from services.jwt_service import jwt_service
@@ -121,19 +122,20 @@ class TestLogin:
         assert isinstance(data['access_token'], str)
         assert isinstance(data['refresh_token'], str)
     
-    def test_login_invalid_username(self, client):
-        """Test login with non-existent username."""
-        from constants import HTTP_NOT_FOUND
-        
+    def test_login_invalid_username(self, client, test_user):
+        """Test login with non-existent username gets the same 401 as a wrong password."""
         response = client.post(
             '/api/login',
             json={'username': 'nonexistent', 'password': 'password123'}
         )
+        wrong_password_response = client.post(
+            '/api/login',
+            json={'username': test_user['username'], 'password': 'password123'}
+        )
         
-        assert response.status_code == HTTP_NOT_FOUND
-        data = response.get_json()
-        assert 'error' in data
-        assert 'not found' in data['error'].lower()
+        assert response.status_code == HTTP_UNAUTHORIZED
+        assert response.get_json() == wrong_password_response.get_json()
+        assert response.get_json() == {'error': 'Invalid username or password'}
     
     def test_login_invalid_password(self, client, test_user):
         """Test login with wrong password."""
@@ -159,6 +161,19 @@ class TestLogin:
         
         assert response.status_code == HTTP_BAD_REQUEST
     
+    def test_login_body_too_large(self, app, client):
+        """Test a request body over MAX_CONTENT_LENGTH is rejected with 413."""
+        app.config['MAX_CONTENT_LENGTH'] = 1024
+        
+        response = client.post(
+            '/api/login',
+            json={'username': 'testuser', 'password': 'x' * 2048}
+        )
+        
+        assert response.status_code == HTTP_PAYLOAD_TOO_LARGE
+        data = response.get_json()
+        assert 'too large' in data['error'].lower()
+    
     def test_login_rate_limit(self, client, test_user):
         """Test rate limiting on login."""
         username = test_user['username']
@@ -400,4 +415,13 @@ class TestRateLimitReset:
         data = response.get_json()
         assert 'all' in data['message'].lower()
         assert 'reset_count' in data
-
+    
+    def test_reset_rate_limit_wrong_key_limited(self, client):
+        """Test repeated wrong reset keys are rate limited."""
+        for _ in range(5):  # Reach max attempts (5)
+            response = client.post('/api/rate-limit/reset', json={'reset_key': 'wrong'})
+            assert response.status_code == HTTP_OK
+        
+        response = client.post('/api/rate-limit/reset', json={'reset_key': 'wrong'})
+        
+        assert response.status_code == HTTP_TOO_MANY_REQUESTS
@@ -0,0 +1,39 @@
+"""Tests for the application error handlers."""
+import pytest
+import errors
+from constants import HTTP_BAD_REQUEST, HTTP_NOT_FOUND
+
+
+@pytest.fixture
+def no_jsonify(monkeypatch):
+    """Fail if an error handler falls back to jsonify instead of a cached body."""
+    def _jsonify(*args, **kwargs):
+        raise AssertionError('expected a pre-serialized error body')
+    monkeypatch.setattr(errors, 'jsonify', _jsonify)
+
+
+class TestStockErrorBodies:
+    """Tests that stock werkzeug errors are served from the pre-serialized bodies."""
+    
+    def test_unknown_route_uses_cached_body(self, client, no_jsonify):
+        """Test a 404 for an unmatched route is served from the cache."""
+        response = client.get('/api/does-not-exist')
+        
+        assert response.status_code == HTTP_NOT_FOUND
+        assert response.mimetype == 'application/json'
+        assert response.get_json()['error'].startswith('404 Not Found:')
+    
+    def test_abort_uses_cached_body(self, client, no_jsonify):
+        """Test abort(400) (non-JSON login body) is served from the cache."""
+        response = client.post('/api/login', data='not json')
+        
+        assert response.status_code == HTTP_BAD_REQUEST
+        assert response.get_json()['error'].startswith('400 Bad Request:')
+    
+    def test_custom_message_falls_back_to_jsonify(self, app):
+        """Test an error with a non-stock message is still serialized."""
+        with app.app_context():
+            response, status_code = errors._error_response('Something specific', HTTP_BAD_REQUEST)
+        
+        assert status_code == HTTP_BAD_REQUEST
+        assert response.get_json() == {'error': 'Something specific'}
@@ -0,0 +1,55 @@
+"""Tests for the orjson-backed JSON provider."""
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+from flask import jsonify
+
+
+class TestOrjsonProvider:
+    """Tests for OrjsonProvider serialization options."""
+    
+    def test_non_str_keys_stringified(self, app):
+        """Test int and float dict keys are stringified like the stdlib json module."""
+        assert app.json.dumps({1: 'a', 2.5: 'b'}) == '{"1":"a","2.5":"b"}'
+    
+    def test_naive_datetime_treated_as_utc(self, app):
+        """Test naive datetimes are serialized as UTC with a 'Z' suffix."""
+        value = datetime(2025, 11, 4, 10, 15, 42, 123456)
+        
+        assert app.json.dumps({'at': value}) == '{"at":"2025-11-04T10:15:42.123456Z"}'
+    
+    def test_aware_utc_datetime_ends_in_z(self, app):
+        """Test aware UTC datetimes use 'Z' rather than '+00:00'."""
+        for tzinfo in (timezone.utc, ZoneInfo('UTC')):
+            value = datetime(2025, 11, 4, 10, 15, 42, tzinfo=tzinfo)
+            assert app.json.dumps(value) == '"2025-11-04T10:15:42Z"'
+    
+    def test_aware_non_utc_datetime_keeps_offset(self, app):
+        """Test non-UTC datetimes keep their offset, matching isoformat()."""
+        value = datetime(2025, 11, 4, 5, 15, 42, tzinfo=ZoneInfo('America/Toronto'))
+        
+        assert app.json.dumps(value) == f'"{value.isoformat()}"'
+    
+    def test_sort_keys_honoured(self, app):
+        """Test sort_keys on the provider and per call."""
+        data = {'b': 1, 'a': 2}
+        
+        app.json.sort_keys = False
+        assert app.json.dumps(data) == '{"b":1,"a":2}'
+        assert app.json.dumps(data, sort_keys=True) == '{"a":2,"b":1}'
+        
+        app.json.sort_keys = True
+        assert app.json.dumps(data) == '{"a":2,"b":1}'
+    
+    def test_compact_false_indents_response(self, app):
+        """Test jsonify output is indented only when compact is False."""
+        with app.app_context():
+            app.json.compact = True
+            assert jsonify(a=1).get_data() == b'{"a":1}\n'
+            
+            app.json.compact = False
+            assert jsonify(a=1).get_data() == b'{\n  "a": 1\n}\n'
+    
+    def test_loads_accepts_str_and_bytes(self, app):
+        """Test request bodies decode from either str or bytes."""
+        assert app.json.loads('{"a":[1,2]}') == {'a': [1, 2]}
+        assert app.json.loads(b'{"a":[1,2]}') == {'a': [1, 2]}
@@ -0,0 +1,43 @@
+"""Tests for the JWT service."""
+import importlib
+from services.jwt_service import JWTService
+
+# services/__init__ re-exports the jwt_service instance under the module's name
+jwt_service_module = importlib.import_module('services.jwt_service')
+
+
+class TestJWTVerifyCache:
+    """Tests for the verified-token cache in JWTService."""
+    
+    def test_cached_token_rejected_once_expired(self, fake_clock):
+        """Test a cached token is rejected after its exp has passed."""
+        service = JWTService()
+        token = service.generate_access_token('testuser')
+        
+        payload = service.verify_token(token)
+        assert payload is not None
+        assert token in service._verify_cache
+        
+        fake_clock(jwt_service_module, now=payload['exp'] + 1)
+        
+        assert service.verify_token(token) is None
+        assert token not in service._verify_cache
+    
+    def test_cache_bounded_by_max_size(self, monkeypatch):
+        """Test the cache evicts least recently used tokens beyond VERIFY_CACHE_MAX_SIZE."""
+        monkeypatch.setattr(jwt_service_module, 'VERIFY_CACHE_MAX_SIZE', 3)
+        service = JWTService()
+        tokens = [service.generate_access_token(f'user{i}') for i in range(5)]
+        
+        for token in tokens:
+            assert service.verify_token(token) is not None
+        
+        assert len(service._verify_cache) == 3
+        assert list(service._verify_cache) == tokens[2:]
+        
+        # A hit refreshes recency, so the next insert evicts tokens[3]
+        service.verify_token(tokens[2])
+        service.verify_token(service.generate_access_token('user5'))
+        assert tokens[2] in service._verify_cache
+        assert tokens[3] not in service._verify_cache
+        assert len(service._verify_cache) == 3
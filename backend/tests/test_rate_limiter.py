@@ -0,0 +1,82 @@
+"""Tests for the rate limiter and client IP resolution."""
+import importlib
+import pytest
+from ipaddress import ip_network
+from flask import request
+from config import get_config
+from utils.rate_limiter import RateLimiter, get_client_ip
+
+rate_limiter_module = importlib.import_module('utils.rate_limiter')
+
+
+class TestRateLimiter:
+    """Tests for rate limiter bookkeeping."""
+    
+    @pytest.fixture
+    def clock(self, fake_clock):
+        """Controllable clock for the rate limiter module."""
+        return fake_clock(rate_limiter_module)
+    
+    def test_lookups_do_not_insert_entries(self, clock):
+        """Test checking or reading status for unknown clients stores nothing."""
+        limiter = RateLimiter()
+        
+        for i in range(10):
+            assert limiter.check_rate_limit(f'203.0.113.{i}', 'testuser') == (True, None, None)
+            assert limiter.get_status(f'198.51.100.{i}')['attempts'] == 0
+        
+        assert limiter.failed_attempts == {}
+    
+    def test_expired_entries_pruned(self, clock):
+        """Test entries past the window are dropped when a later failure is recorded."""
+        Config = get_config()
+        limiter = RateLimiter()
+        
+        limiter.record_failed_attempt('203.0.113.1', 'testuser')
+        limiter.record_failed_attempt('203.0.113.2')
+        assert len(limiter.failed_attempts) == 2
+        
+        clock.now += Config.RATE_LIMIT_WINDOW_SECONDS + 1
+        limiter.record_failed_attempt('203.0.113.3')
+        
+        assert list(limiter.failed_attempts) == ['203.0.113.3']
+    
+    def test_locked_entries_kept_until_lock_expires(self, clock, monkeypatch):
+        """Test pruning keeps a locked-out client until its lockout ends."""
+        Config = get_config()
+        monkeypatch.setattr(Config, 'RATE_LIMIT_WINDOW_SECONDS', 300)
+        monkeypatch.setattr(Config, 'RATE_LIMIT_LOCKOUT_DURATION', 900)
+        limiter = RateLimiter()
+        
+        for _ in range(Config.RATE_LIMIT_MAX_ATTEMPTS):
+            limiter.record_failed_attempt('203.0.113.1', 'testuser')
+        
+        # Window elapsed but still locked out: kept
+        clock.now += 301
+        limiter.record_failed_attempt('203.0.113.2')
+        assert '203.0.113.1:testuser' in limiter.failed_attempts
+        
+        # Lockout over: pruned on the next prune pass
+        clock.now += 900
+        limiter.record_failed_attempt('203.0.113.3')
+        assert '203.0.113.1:testuser' not in limiter.failed_attempts
+
+
+class TestClientIp:
+    """Tests for client IP resolution behind a reverse proxy."""
+    
+    def _resolve(self, app, remote_addr, forwarded=None):
+        headers = {'X-Forwarded-For': forwarded} if forwarded else {}
+        with app.test_request_context(headers=headers, environ_base={'REMOTE_ADDR': remote_addr}):
+            return get_client_ip(request)
+    
+    def test_forwarded_for_ignored_without_trusted_proxies(self, app):
+        """Test X-Forwarded-For is ignored when no proxies are trusted."""
+        assert self._resolve(app, '10.0.0.1', '203.0.113.7') == '10.0.0.1'
+    
+    def test_forwarded_for_from_trusted_proxy(self, app, monkeypatch):
+        """Test the rightmost untrusted X-Forwarded-For hop is used behind a trusted proxy."""
+        monkeypatch.setattr(rate_limiter_module, '_TRUSTED_PROXY_NETWORKS', (ip_network('10.0.0.0/8'),))
+        
+        assert self._resolve(app, '10.0.0.1', '198.51.100.1, 203.0.113.7, 10.0.0.2') == '203.0.113.7'
+        assert self._resolve(app, '192.0.2.5', '203.0.113.7') == '192.0.2.5'
@@ -0,0 +1,100 @@
+"""Tests for per-minute averaging in the reading service."""
+import pytest
+from models.reading import Reading
+from services.reading_service import ReadingService
+
+
+@pytest.fixture
+def reading_service():
+    """ReadingService that only needs its averaging helpers (no storage access)."""
+    return ReadingService(storage=object())
+
+
+def _readings(*pairs):
+    return [Reading(tempC=temp_c, recordedAt=recorded_at) for temp_c, recorded_at in pairs]
+
+
+class TestAverageByMinute:
+    """Tests for the sorted fast path and the unsorted fallback."""
+    
+    def test_sorted_input_single_pass(self, reading_service):
+        """Test sorted canonical timestamps are averaged per minute."""
+        readings = _readings(
+            (20.0, '2025-11-04T10:15:01.000000Z'),
+            (21.0, '2025-11-04T10:15:59.999999Z'),
+            (22.5, '2025-11-04T10:16:00.000000Z'),
+        )
+        
+        result = reading_service._average_by_minute(readings)
+        
+        assert [r.to_dict() for r in result] == [
+            {'tempC': 20.5, 'recordedAt': '2025-11-04T10:15:00Z'},
+            {'tempC': 22.5, 'recordedAt': '2025-11-04T10:16:00Z'},
+        ]
+    
+    def test_unsorted_input_matches_sorted(self, reading_service):
+        """Test out-of-order input falls back to grouping and gives the same minutes."""
+        readings = _readings(
+            (20.0, '2025-11-04T10:15:01.000000Z'),
+            (22.5, '2025-11-04T10:16:00.000000Z'),
+            (21.0, '2025-11-04T10:15:59.999999Z'),
+            (19.0, '2025-11-04T10:14:30.000000Z'),
+        )
+        
+        result = reading_service._average_by_minute(readings)
+        
+        assert [r.to_dict() for r in result] == [
+            {'tempC': 19.0, 'recordedAt': '2025-11-04T10:14:00Z'},
+            {'tempC': 20.5, 'recordedAt': '2025-11-04T10:15:00Z'},
+            {'tempC': 22.5, 'recordedAt': '2025-11-04T10:16:00Z'},
+        ]
+    
+    def test_fast_path_and_fallback_agree(self, reading_service):
+        """Test both paths produce identical averages, including float rounding."""
+        readings = _readings(
+            (0.1, '2025-11-04T10:15:01Z'),
+            (0.2, '2025-11-04T10:15:02Z'),
+            (0.7, '2025-11-04T10:15:03Z'),
+            (21.105, '2025-11-04T10:16:01Z'),
+            (21.115, '2025-11-04T10:16:02Z'),
+        )
+        
+        fast = reading_service._average_by_minute(readings)
+        fallback = reading_service._average_by_minute_unsorted(readings)
+        
+        assert [r.to_dict() for r in fast] == [r.to_dict() for r in fallback]
+    
+    def test_non_z_offsets_normalized_to_utc(self, reading_service):
+        """Test offset, +00:00 and naive timestamps are bucketed by UTC minute."""
+        readings = _readings(
+            (20.0, '2025-11-04T05:15:10-05:00'),
+            (22.0, '2025-11-04T10:15:20+00:00'),
+            (24.0, '2025-11-04T10:15:30'),
+            (26.0, '2025-11-04T11:16:40+01:00'),
+        )
+        
+        result = reading_service._average_by_minute(readings)
+        
+        assert [r.to_dict() for r in result] == [
+            {'tempC': 22.0, 'recordedAt': '2025-11-04T10:15:00Z'},
+            {'tempC': 26.0, 'recordedAt': '2025-11-04T10:16:00Z'},
+        ]
+    
+    def test_dst_fall_back_minutes_kept_apart(self, reading_service):
+        """Test the repeated 01:30 Toronto wall time on DST fall-back maps to two UTC minutes."""
+        readings = _readings(
+            (18.0, '2025-11-02T01:30:00-05:00'),  # EST, 06:30Z
+            (20.0, '2025-11-02T01:30:00-04:00'),  # EDT, 05:30Z
+            (21.0, '2025-11-02T05:30:30Z'),
+        )
+        
+        result = reading_service._average_by_minute(readings)
+        
+        assert [r.to_dict() for r in result] == [
+            {'tempC': 20.5, 'recordedAt': '2025-11-02T05:30:00Z'},
+            {'tempC': 18.0, 'recordedAt': '2025-11-02T06:30:00Z'},
+        ]
+    
+    def test_empty_input(self, reading_service):
+        """Test no readings give no minutes."""
+        assert reading_service._average_by_minute([]) == []
@@ -0,0 +1,90 @@
+"""Tests for temperature reading routes."""
+import importlib
+import json
+import pytest
+from models.reading import Reading
+from services.reading_service import ReadingService
+from constants import HTTP_OK
+
+
+class _FakeReadingStorage:
+    """In-memory stand-in for ReadingStorage."""
+    
+    def __init__(self, readings):
+        self.readings = readings
+    
+    def read_readings(self, start_datetime_utc, end_datetime_utc):
+        return list(self.readings)
+
+
+@pytest.fixture
+def access_token(client, test_user):
+    """Access token for the test user."""
+    response = client.post('/api/login', json=test_user)
+    return response.get_json()['access_token']
+
+
+@pytest.fixture
+def readings_storage(app, monkeypatch):
+    """Serve /api/readings from an in-memory list of readings."""
+    # After app, which reloads routes.readings and would undo the patch
+    readings_module = importlib.import_module('routes.readings')
+    storage = _FakeReadingStorage([])
+    service = ReadingService(storage=storage)
+    monkeypatch.setattr(readings_module, 'get_reading_service', lambda: service)
+    return storage
+
+
+class TestGetReadings:
+    """Tests for GET /api/readings."""
+    
+    def _get(self, client, access_token, auth_headers):
+        return client.get(
+            '/api/readings',
+            headers=auth_headers(access_token),
+            query_string={'startDateTime': '2025-01-15T10:00:00Z', 'endDateTime': '2025-07-15T11:00:00Z'}
+        )
+    
+    def test_streamed_body_is_valid_json(self, client, access_token, auth_headers, readings_storage):
+        """Test several readings stream as one JSON document with the right count."""
+        readings_storage.readings = [
+            Reading(tempC=20.0, recordedAt='2025-01-15T10:15:01.000000Z'),
+            Reading(tempC=21.0, recordedAt='2025-01-15T10:15:30.000000Z'),
+            Reading(tempC=22.5, recordedAt='2025-01-15T10:16:00.000000Z'),
+            Reading(tempC=23.25, recordedAt='2025-07-15T10:17:00.000000Z'),
+        ]
+        
+        response = self._get(client, access_token, auth_headers)
+        
+        assert response.status_code == HTTP_OK
+        assert response.mimetype == 'application/json'
+        data = json.loads(response.get_data(as_text=True))
+        assert data['message'] == 'Readings retrieved'
+        assert data['count'] == len(data['readings']) == 3
+        assert [r['tempC'] for r in data['readings']] == [20.5, 22.5, 23.25]
+    
+    def test_recorded_at_in_toronto_time(self, client, access_token, auth_headers, readings_storage):
+        """Test recordedAt carries the Toronto offset for both EST and EDT."""
+        readings_storage.readings = [
+            Reading(tempC=20.0, recordedAt='2025-01-15T10:15:00.000000Z'),
+            Reading(tempC=21.0, recordedAt='2025-07-15T10:15:00.000000Z'),
+        ]
+        
+        response = self._get(client, access_token, auth_headers)
+        
+        data = json.loads(response.get_data(as_text=True))
+        assert [r['recordedAt'] for r in data['readings']] == [
+            '2025-01-15T05:15:00-05:00',
+            '2025-07-15T06:15:00-04:00',
+        ]
+    
+    def test_no_readings(self, client, access_token, auth_headers, readings_storage):
+        """Test an empty range gives an empty list."""
+        response = self._get(client, access_token, auth_headers)
+        
+        assert response.status_code == HTTP_OK
+        assert json.loads(response.get_data(as_text=True)) == {
+            'message': 'Readings retrieved',
+            'count': 0,
+            'readings': []
+        }
@@ -0,0 +1,46 @@
+"""Tests for the Arduino command queue."""
+import importlib
+import pytest
+from services.serial_manager import SerialPortManager
+
+serial_manager_module = importlib.import_module('services.serial_manager')
+
+
+@pytest.fixture
+def serial_manager(test_config, fake_clock):
+    """SerialPortManager backed by the isolated test storage directory."""
+    # Commands are matched by timestamp, so give each one a distinct time
+    fake_clock(serial_manager_module, step=1.0)
+    return SerialPortManager()
+
+
+class TestCommandQueue:
+    """Tests for queueing and marking commands."""
+    
+    def test_mark_batch_keeps_later_commands_pending(self, serial_manager):
+        """Test commands queued after a batch was read stay pending once it is marked."""
+        serial_manager.queue_command('START')
+        serial_manager.queue_command('TOGGLE')
+        batch = serial_manager.get_pending_commands()
+        
+        serial_manager.queue_command('STOP')
+        
+        assert serial_manager.mark_commands_processed([cmd['timestamp'] for cmd in batch])
+        
+        pending = serial_manager.get_pending_commands()
+        assert [cmd['command'] for cmd in pending] == ['STOP']
+        processed = [
+            cmd for cmd in serial_manager._read_command_queue()
+            if cmd['status'] == 'processed'
+        ]
+        assert [cmd['command'] for cmd in processed] == ['START', 'TOGGLE']
+    
+    def test_mark_single_command_processed(self, serial_manager):
+        """Test marking one command leaves the others pending."""
+        serial_manager.queue_command('START')
+        serial_manager.queue_command('STOP')
+        first = serial_manager.get_pending_commands()[0]
+        
+        assert serial_manager.mark_command_processed(first['timestamp'])
+        
+        assert [cmd['command'] for cmd in serial_manager.get_pending_commands()] == ['STOP']
@@ -0,0 +1,59 @@
+"""Tests for timezone utilities."""
+import importlib
+import pytest
+from datetime import datetime, timezone
+from utils.timezone_utils import utc_now_iso
+
+timezone_utils_module = importlib.import_module('utils.timezone_utils')
+
+# 2025-11-04T04:04:25Z
+_SECOND = int(datetime(2025, 11, 4, 4, 4, 25, tzinfo=timezone.utc).timestamp())
+
+
+@pytest.fixture
+def time_ns(fake_clock, monkeypatch):
+    """Set the nanosecond clock seen by utc_now_iso, with an empty prefix cache."""
+    clock = fake_clock(timezone_utils_module)
+    monkeypatch.setattr(timezone_utils_module, '_utc_second_prefix', (None, ''))
+    
+    def _set(nanoseconds: int) -> None:
+        clock.time_ns = lambda: nanoseconds
+    return _set
+
+
+class TestUtcNowIso:
+    """Tests for the canonical UTC timestamp format written by serial ingest."""
+    
+    def test_format(self, time_ns):
+        """Test the timestamp is 'YYYY-MM-DDTHH:MM:SS.ffffffZ'."""
+        time_ns(_SECOND * 1_000_000_000 + 206_644_999)
+        
+        assert utc_now_iso() == '2025-11-04T04:04:25.206644Z'
+    
+    def test_zero_microseconds_kept(self, time_ns):
+        """Test microseconds are written even when zero, unlike isoformat()."""
+        time_ns(_SECOND * 1_000_000_000 + 999)
+        
+        assert utc_now_iso() == '2025-11-04T04:04:25.000000Z'
+    
+    def test_second_rollover(self, time_ns):
+        """Test the cached prefix is rebuilt when the second changes."""
+        time_ns(_SECOND * 1_000_000_000 + 999_999_000)
+        assert utc_now_iso() == '2025-11-04T04:04:25.999999Z'
+        
+        time_ns((_SECOND + 1) * 1_000_000_000)
+        assert utc_now_iso() == '2025-11-04T04:04:26.000000Z'
+        
+        # Midnight and year boundaries go through the same path
+        new_year = int(datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp())
+        time_ns(new_year * 1_000_000_000 - 1_000)
+        assert utc_now_iso() == '2025-12-31T23:59:59.999999Z'
+        time_ns(new_year * 1_000_000_000)
+        assert utc_now_iso() == '2026-01-01T00:00:00.000000Z'
+    
+    def test_matches_minute_key_fast_path(self, time_ns):
+        """Test the reading service's sliced minute key matches the timestamp's UTC minute."""
+        from services.reading_service import _utc_minute_key
+        time_ns(_SECOND * 1_000_000_000 + 123_456_000)
+        
+        assert _utc_minute_key(utc_now_iso()) == '2025-11-04T04:04'
@@ -0,0 +1,52 @@
+"""Tests for token storage."""
+from constants import HTTP_UNAUTHORIZED
+from services.token_storage import TokenStorage, token_storage
+
+
+class TestTokenStorage:
+    """Tests for fingerprint-based token storage."""
+    
+    def test_blacklisted_token_rejected(self, client, test_user, auth_headers):
+        """Test a blacklisted access token no longer authenticates."""
+        login_response = client.post('/api/login', json=test_user)
+        access_token = login_response.get_json()['access_token']
+        
+        token_storage.blacklist_token(access_token)
+        
+        assert token_storage.is_token_blacklisted(access_token)
+        response = client.get(
+            '/api/readings',
+            headers=auth_headers(access_token),
+            query_string={'startDateTime': '2025-11-04T10:00:00Z', 'endDateTime': '2025-11-04T11:00:00Z'}
+        )
+        assert response.status_code == HTTP_UNAUTHORIZED
+        assert 'revoked' in response.get_json()['error'].lower()
+    
+    def test_revoke_all_user_tokens_blacklists_every_token(self):
+        """Test revoking all of a user's tokens blacklists each active refresh token."""
+        storage = TokenStorage()
+        tokens = ['refresh-token-1', 'refresh-token-2', 'refresh-token-3']
+        for token in tokens:
+            storage.add_refresh_token('testuser', token)
+        storage.add_refresh_token('otheruser', 'other-refresh-token')
+        
+        assert storage.revoke_all_user_tokens('testuser') == len(tokens)
+        
+        for token in tokens:
+            assert storage.is_token_blacklisted(token)
+            assert not storage.is_refresh_token_active('testuser', token)
+        assert not storage.is_token_blacklisted('other-refresh-token')
+        assert storage.is_refresh_token_active('otheruser', 'other-refresh-token')
+        assert storage.revoke_all_user_tokens('testuser') == 0
+    
+    def test_different_token_not_matched(self):
+        """Test a token is not matched by another token's fingerprint."""
+        storage = TokenStorage()
+        storage.add_refresh_token('testuser', 'refresh-token-1')
+        storage.blacklist_token('access-token-1')
+        
+        assert storage.is_refresh_token_active('testuser', 'refresh-token-1')
+        assert not storage.is_refresh_token_active('testuser', 'refresh-token-2')
+        assert not storage.is_refresh_token_active('otheruser', 'refresh-token-1')
+        assert storage.is_token_blacklisted('access-token-1')
+        assert not storage.is_token_blacklisted('access-token-2')
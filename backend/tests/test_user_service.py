@@ -0,0 +1,75 @@
+"""Tests for the user service."""
+import bcrypt
+import pytest
+from services.user_service import (
+    UserService,
+    CREDENTIALS_OK,
+    CREDENTIALS_USER_MISSING,
+    CREDENTIALS_PASSWORD_MISMATCH
+)
+
+
+@pytest.fixture
+def user_service(test_config):
+    """UserService backed by the isolated test users file."""
+    return UserService()
+
+
+class TestUserCache:
+    """Tests for the user record cache and its invalidation."""
+    
+    def test_repeat_lookup_served_from_cache(self, user_service, monkeypatch):
+        """Test a found user is not read from storage again while the file is unchanged."""
+        user_service.create_user('testuser', 'testpass123')
+        assert user_service.user_exists('testuser')
+        
+        def _fail(*args, **kwargs):
+            raise AssertionError('expected a cache hit')
+        monkeypatch.setattr(user_service.storage, 'get_user_by_username', _fail)
+        
+        assert user_service.verify_credentials('testuser', 'testpass123') == CREDENTIALS_OK
+    
+    def test_removed_user_stops_matching(self, user_service):
+        """Test a user deleted by editing the users file no longer logs in."""
+        user_service.create_user('testuser', 'testpass123')
+        assert user_service.verify_credentials('testuser', 'testpass123') == CREDENTIALS_OK
+        
+        users = [u for u in user_service.storage.read() if u.get('username') != 'testuser']
+        user_service.storage.write(users)
+        
+        assert user_service.verify_credentials('testuser', 'testpass123') == CREDENTIALS_USER_MISSING
+    
+    def test_replaced_hash_takes_effect(self, user_service):
+        """Test a password hash replaced in the users file is used on the next login."""
+        user_service.create_user('testuser', 'testpass123')
+        assert user_service.verify_credentials('testuser', 'testpass123') == CREDENTIALS_OK
+        
+        new_hash = bcrypt.hashpw(b'newpass456', bcrypt.gensalt(rounds=4)).decode('utf-8')
+        users = user_service.storage.read()
+        for user in users:
+            if user.get('username') == 'testuser':
+                user['password'] = new_hash
+        user_service.storage.write(users)
+        
+        assert user_service.verify_credentials('testuser', 'testpass123') == CREDENTIALS_PASSWORD_MISMATCH
+        assert user_service.verify_credentials('testuser', 'newpass456') == CREDENTIALS_OK
+    
+    def test_miss_cached_until_file_changes(self, user_service, monkeypatch):
+        """Test an unknown username is not re-read, yet is found once it is added."""
+        assert not user_service.user_exists('newuser')
+        
+        reads = []
+        original = user_service.storage.get_user_by_username
+        def _counting(username):
+            reads.append(username)
+            return original(username)
+        monkeypatch.setattr(user_service.storage, 'get_user_by_username', _counting)
+        
+        assert not user_service.user_exists('newuser')
+        assert reads == []
+        
+        # Another process (here: a second service) registers the user
+        UserService().create_user('newuser', 'testpass123')
+        
+        assert user_service.user_exists('newuser')
+        assert reads == ['newuser']
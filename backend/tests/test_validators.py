@@ -0,0 +1,41 @@
+"""Tests for request validation utilities."""
+import pytest
+from config import get_config
+from constants import HTTP_BAD_REQUEST
+from exceptions import ValidationError
+from utils.validators import (
+    required_field_response,
+    validate_username,
+    validate_password,
+    USERNAME_REQUIRED_MESSAGE
+)
+
+
+class TestRequiredFieldResponse:
+    """Tests for the pre-serialized missing-credential responses."""
+    
+    @pytest.mark.parametrize('field, validator', [
+        ('username', validate_username),
+        ('password', validate_password),
+    ])
+    def test_matches_validation_error_response(self, app, field, validator):
+        """Test the shortcut response is byte-for-byte what the validator's ValidationError produces."""
+        # Serialize as the app does (main.py applies JSON_SORT_KEYS to the provider)
+        app.json.sort_keys = get_config().JSON_SORT_KEYS
+        is_valid, message = validator('')
+        assert not is_valid
+        
+        with app.test_request_context():
+            response, status_code = required_field_response(field)
+            expected = app.make_response(app.handle_user_exception(ValidationError(message, field=field)))
+        
+        assert status_code == expected.status_code == HTTP_BAD_REQUEST
+        assert response.mimetype == expected.mimetype
+        assert response.get_data() == expected.get_data()
+    
+    def test_logs_warning(self, app, caplog):
+        """Test the shortcut still logs the validation failure."""
+        with app.test_request_context(), caplog.at_level('WARNING', logger='utils.validators'):
+            required_field_response('username')
+        
+        assert any(USERNAME_REQUIRED_MESSAGE in record.getMessage() for record in caplog.records)
@@ -1,16 +1,27 @@
 """Logging configuration for the temperature monitoring system."""
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
+from typing import Optional
 from config import get_config
 
 Config = get_config()
 
+# Background listener that drains queued log records to the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(log_level: str = None) -> logging.Logger:
     """
     Set up logging configuration for the application.
     
+    The root logger only gets a QueueHandler, so logging calls on request
+    threads just enqueue the record; a QueueListener thread writes it to the
+    console and log files.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
                    Defaults to DEBUG if Config.DEBUG is True, otherwise INFO.
@@ -34,6 +45,7 @@ def setup_logging(log_level: str = None) -> logging.Logger:
     
     # Remove existing handlers to avoid duplicates
     root_logger.handlers.clear()
+    _stop_queue_listener()
     
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -49,25 +61,49 @@ def setup_logging(log_level: str = None) -> logging.Logger:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(simple_formatter)
-    root_logger.addHandler(console_handler)
     
     # File handler (app.log)
     log_file = logs_dir / 'app.log'
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
     file_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(file_handler)
     
     # Error file handler (errors.log)
     error_log_file = logs_dir / 'errors.log'
     error_handler = logging.FileHandler(error_log_file, encoding='utf-8')
     error_handler.setLevel(logging.ERROR)  # Only errors and above
     error_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(error_handler)
+    
+    # Hand records to the handlers above from a background thread
+    global _queue_listener
+    log_queue: queue.Queue = queue.Queue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        error_handler,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
     
     return root_logger
 
 
+def _stop_queue_listener() -> None:
+    """Flush queued log records and stop the background listener, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+# Drain any queued records on interpreter exit
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -21,30 +21,39 @@ def request_logging_middleware(app) -> None:
         """Log incoming request information."""
         g.start_time = time.time()
         
-        logger.info(
-            f"Incoming request: {request.method} {request.path}",
-            extra={
-                'method': request.method,
-                'path': request.path,
-                'remote_addr': request.remote_addr,
-                'user_agent': request.headers.get('User-Agent', 'Unknown')
-            }
-        )
+        # Skip building the extra dict when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Incoming request: %s %s",
+                request.method,
+                request.path,
+                extra={
+                    'method': request.method,
+                    'path': request.path,
+                    'remote_addr': request.remote_addr,
+                    'user_agent': request.headers.get('User-Agent', 'Unknown')
+                }
+            )
     
     @app.after_request
     def log_response_info(response) -> None:
         """Log response information."""
         duration = time.time() - g.get('start_time', 0)
         
-        logger.info(
-            f"Response: {request.method} {request.path} - {response.status_code} ({duration:.3f}s)",
-            extra={
-                'method': request.method,
-                'path': request.path,
-                'status_code': response.status_code,
-                'duration': duration
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Response: %s %s - %s (%.3fs)",
+                request.method,
+                request.path,
+                response.status_code,
+                duration,
+                extra={
+                    'method': request.method,
+                    'path': request.path,
+                    'status_code': response.status_code,
+                    'duration': duration
+                }
+            )
         
         return response
     
@@ -52,7 +61,8 @@ def request_logging_middleware(app) -> None:
     def log_internal_error(error: Exception) -> None:
         """Log internal server errors."""
         logger.error(
-            f"Internal server error: {str(error)}",
+            "Internal server error: %s",
+            error,
             exc_info=True,
             extra={
                 'method': request.method,
@@ -1,14 +1,58 @@
 """Rate limiting for authentication endpoints."""
 import time
 import logging
+from ipaddress import ip_address as parse_ip, ip_network
+from threading import Lock
 from typing import Dict, Optional, Tuple
+from flask import Request
 from datetime import datetime, timedelta
-from collections import defaultdict
 from config import get_config
 
 Config = get_config()
 logger = logging.getLogger(__name__)
 
+# Trusted reverse-proxy networks, parsed once at import
+_TRUSTED_PROXY_NETWORKS = tuple(ip_network(cidr, strict=False) for cidr in Config.TRUSTED_PROXY_CIDRS)
+
+
+def _is_trusted_proxy(address: str) -> bool:
+    """Check whether an address falls in one of the trusted proxy networks."""
+    try:
+        ip = parse_ip(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _TRUSTED_PROXY_NETWORKS)
+
+
+def get_client_ip(req: Request) -> str:
+    """
+    Resolve the client IP address used for rate limiting.
+    
+    X-Forwarded-For is honoured only when the direct peer is a trusted proxy
+    (Config.TRUSTED_PROXY_CIDRS). The header is walked right to left, skipping
+    trusted proxies, so a client cannot spoof its address by prepending entries.
+    
+    Args:
+        req: Current Flask request
+        
+    Returns:
+        Client IP address, or 'unknown' if it cannot be determined
+    """
+    address = req.remote_addr
+    if not address or not _TRUSTED_PROXY_NETWORKS or not _is_trusted_proxy(address):
+        return address or 'unknown'
+    
+    forwarded = req.headers.get('X-Forwarded-For', '')
+    while forwarded:
+        forwarded, _, hop = forwarded.rpartition(',')
+        hop = hop.strip()
+        if not hop:
+            continue
+        address = hop
+        if not _is_trusted_proxy(hop):
+            break
+    return address
+
 
 class RateLimiter:
     """Rate limiter for tracking and limiting failed authentication attempts."""
@@ -16,11 +60,57 @@ class RateLimiter:
     def __init__(self):
         """Initialize rate limiter with in-memory storage."""
         # Track failed attempts: {identifier: {'attempts': count, 'first_attempt': timestamp, 'locked_until': timestamp}}
-        self.failed_attempts: Dict[str, Dict] = defaultdict(lambda: {
+        # Only identifiers with recorded failures have an entry; lookups never insert
+        self.failed_attempts: Dict[str, Dict] = {}
+        # Serializes check/record/reset so concurrent requests see consistent counts
+        self._lock = Lock()
+        self._next_prune = time.time() + Config.RATE_LIMIT_WINDOW_SECONDS
+    
+    @staticmethod
+    def _new_entry() -> Dict:
+        """Create an empty failed-attempts entry."""
+        return {
             'attempts': 0,
             'first_attempt': None,
             'locked_until': None
-        })
+        }
+    
+    def _is_expired(self, entry: Dict, current_time: float) -> bool:
+        """
+        Check if an entry no longer affects rate limiting (not locked, window elapsed).
+        
+        Args:
+            entry: Failed-attempts entry
+            current_time: Current timestamp
+            
+        Returns:
+            True if the entry can be discarded, False otherwise
+        """
+        if entry['locked_until']:
+            return entry['locked_until'] <= current_time
+        return (
+            not entry['first_attempt']
+            or current_time - entry['first_attempt'] > Config.RATE_LIMIT_WINDOW_SECONDS
+        )
+    
+    def _prune_expired(self, current_time: float) -> None:
+        """
+        Drop entries that have expired, at most once per rate limit window.
+        
+        Args:
+            current_time: Current timestamp
+        """
+        if current_time < self._next_prune:
+            return
+        self._next_prune = current_time + Config.RATE_LIMIT_WINDOW_SECONDS
+        expired = [
+            identifier for identifier, entry in self.failed_attempts.items()
+            if self._is_expired(entry, current_time)
+        ]
+        for identifier in expired:
+            del self.failed_attempts[identifier]
+        if expired:
+            logger.debug("Pruned %d expired rate limit entries", len(expired))
     
     def _get_identifier(self, ip_address: str, username: Optional[str] = None) -> str:
         """
@@ -47,14 +137,13 @@ class RateLimiter:
         Returns:
             True if locked, False otherwise
         """
-        entry = self.failed_attempts[identifier]
-        if entry['locked_until'] and entry['locked_until'] > time.time():
+        entry = self.failed_attempts.get(identifier)
+        if entry is None or not entry['locked_until']:
+            return False
+        if entry['locked_until'] > time.time():
             return True
         # Clear lock if expired
-        if entry['locked_until'] and entry['locked_until'] <= time.time():
-            entry['locked_until'] = None
-            entry['attempts'] = 0
-            entry['first_attempt'] = None
+        del self.failed_attempts[identifier]
         return False
     
     def _get_lockout_duration(self, attempts: int) -> int:
@@ -84,26 +173,31 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, error_message, retry_after_seconds)
         """
-        identifier = self._get_identifier(ip_address, username)
-        entry = self.failed_attempts[identifier]
-        
-        # Check if currently locked
-        if self._is_locked(identifier):
-            retry_after = int(entry['locked_until'] - time.time())
-            error_msg = f"Too many failed attempts. Please try again in {retry_after} seconds."
-            logger.warning(f"Rate limit exceeded for {identifier}: {entry['attempts']} attempts")
-            return False, error_msg, retry_after
-        
-        # Check if within time window
-        current_time = time.time()
-        if entry['first_attempt']:
-            time_since_first = current_time - entry['first_attempt']
-            if time_since_first > Config.RATE_LIMIT_WINDOW_SECONDS:
-                # Reset if window expired
-                entry['attempts'] = 0
-                entry['first_attempt'] = None
+        with self._lock:
+            identifier = self._get_identifier(ip_address, username)
+            entry = self.failed_attempts.get(identifier)
+        
+            # No recorded failures: nothing to check (and nothing to store)
+            if entry is None:
+                return True, None, None
+        
+            # Check if currently locked
+            if self._is_locked(identifier):
+                retry_after = int(entry['locked_until'] - time.time())
+                error_msg = f"Too many failed attempts. Please try again in {retry_after} seconds."
+                logger.warning(f"Rate limit exceeded for {identifier}: {entry['attempts']} attempts")
+                return False, error_msg, retry_after
         
-        return True, None, None
+            # Check if within time window (an expired lock has already cleared the entry)
+            current_time = time.time()
+            entry = self.failed_attempts.get(identifier)
+            if entry and entry['first_attempt']:
+                time_since_first = current_time - entry['first_attempt']
+                if time_since_first > Config.RATE_LIMIT_WINDOW_SECONDS:
+                    # Reset if window expired
+                    del self.failed_attempts[identifier]
+        
+            return True, None, None
     
     def record_failed_attempt(self, ip_address: str, username: Optional[str] = None) -> None:
         """
@@ -113,25 +207,30 @@ class RateLimiter:
             ip_address: Client IP address
             username: Optional username for login attempts
         """
-        identifier = self._get_identifier(ip_address, username)
-        entry = self.failed_attempts[identifier]
-        current_time = time.time()
-        
-        # Initialize or reset if window expired
-        if not entry['first_attempt'] or (current_time - entry['first_attempt']) > Config.RATE_LIMIT_WINDOW_SECONDS:
-            entry['first_attempt'] = current_time
-            entry['attempts'] = 0
-        
-        entry['attempts'] += 1
-        
-        # Apply lockout if threshold reached
-        if entry['attempts'] >= Config.RATE_LIMIT_MAX_ATTEMPTS:
-            lockout_duration = self._get_lockout_duration(entry['attempts'])
-            entry['locked_until'] = current_time + lockout_duration
-            logger.warning(
-                f"Rate limit lockout applied for {identifier}: "
-                f"{entry['attempts']} attempts, locked for {lockout_duration}s"
-            )
+        with self._lock:
+            identifier = self._get_identifier(ip_address, username)
+            current_time = time.time()
+            self._prune_expired(current_time)
+        
+            entry = self.failed_attempts.get(identifier)
+            if entry is None:
+                entry = self.failed_attempts[identifier] = self._new_entry()
+        
+            # Initialize or reset if window expired
+            if not entry['first_attempt'] or (current_time - entry['first_attempt']) > Config.RATE_LIMIT_WINDOW_SECONDS:
+                entry['first_attempt'] = current_time
+                entry['attempts'] = 0
+        
+            entry['attempts'] += 1
+        
+            # Apply lockout if threshold reached
+            if entry['attempts'] >= Config.RATE_LIMIT_MAX_ATTEMPTS:
+                lockout_duration = self._get_lockout_duration(entry['attempts'])
+                entry['locked_until'] = current_time + lockout_duration
+                logger.warning(
+                    f"Rate limit lockout applied for {identifier}: "
+                    f"{entry['attempts']} attempts, locked for {lockout_duration}s"
+                )
     
     def reset_attempts(self, ip_address: str, username: Optional[str] = None) -> bool:
         """
@@ -144,16 +243,13 @@ class RateLimiter:
         Returns:
             True if reset was successful, False if identifier not found
         """
-        identifier = self._get_identifier(ip_address, username)
-        if identifier in self.failed_attempts:
-            self.failed_attempts[identifier] = {
-                'attempts': 0,
-                'first_attempt': None,
-                'locked_until': None
-            }
-            logger.info(f"Rate limit reset for {identifier}")
-            return True
-        return False
+        with self._lock:
+            identifier = self._get_identifier(ip_address, username)
+            if identifier in self.failed_attempts:
+                del self.failed_attempts[identifier]
+                logger.info(f"Rate limit reset for {identifier}")
+                return True
+            return False
     
     def reset_all(self) -> int:
         """
@@ -162,10 +258,11 @@ class RateLimiter:
         Returns:
             Number of identifiers reset
         """
-        count = len(self.failed_attempts)
-        self.failed_attempts.clear()
-        logger.info(f"All rate limits reset ({count} identifiers)")
-        return count
+        with self._lock:
+            count = len(self.failed_attempts)
+            self.failed_attempts.clear()
+            logger.info(f"All rate limits reset ({count} identifiers)")
+            return count
     
     def get_status(self, ip_address: str, username: Optional[str] = None) -> Dict:
         """
@@ -178,32 +275,38 @@ class RateLimiter:
         Returns:
             Dictionary with rate limit status
         """
-        identifier = self._get_identifier(ip_address, username)
-        entry = self.failed_attempts[identifier]
+        with self._lock:
+            identifier = self._get_identifier(ip_address, username)
+            is_locked = self._is_locked(identifier)
+            entry = self.failed_attempts.get(identifier) or self._new_entry()
         
-        status = {
-            'attempts': entry['attempts'],
-            'max_attempts': Config.RATE_LIMIT_MAX_ATTEMPTS,
-            'is_locked': self._is_locked(identifier),
-            'remaining_attempts': max(0, Config.RATE_LIMIT_MAX_ATTEMPTS - entry['attempts'])
-        }
+            status = {
+                'attempts': entry['attempts'],
+                'max_attempts': Config.RATE_LIMIT_MAX_ATTEMPTS,
+                'is_locked': is_locked,
+                'remaining_attempts': max(0, Config.RATE_LIMIT_MAX_ATTEMPTS - entry['attempts'])
+            }
         
-        if entry['locked_until']:
-            status['locked_until'] = entry['locked_until']
-            status['retry_after'] = int(entry['locked_until'] - time.time())
-        else:
-            status['locked_until'] = None
-            status['retry_after'] = None
-        
-        if entry['first_attempt']:
-            window_remaining = Config.RATE_LIMIT_WINDOW_SECONDS - (time.time() - entry['first_attempt'])
-            status['window_remaining'] = max(0, int(window_remaining))
-        else:
-            status['window_remaining'] = None
-        
-        return status
+            if entry['locked_until']:
+                status['locked_until'] = entry['locked_until']
+                status['retry_after'] = int(entry['locked_until'] - time.time())
+            else:
+                status['locked_until'] = None
+                status['retry_after'] = None
+        
+            if entry['first_attempt']:
+                window_remaining = Config.RATE_LIMIT_WINDOW_SECONDS - (time.time() - entry['first_attempt'])
+                status['window_remaining'] = max(0, int(window_remaining))
+            else:
+                status['window_remaining'] = None
+        
+            return status
 
 
 # Global rate limiter instance
 rate_limiter = RateLimiter()
 
+# Separate limiter for wrong rate-limit reset keys, so the reset endpoint
+# cannot be used to clear its own lockout
+reset_key_rate_limiter = RateLimiter()
+
@@ -1,6 +1,8 @@
 """Timezone conversion utilities."""
 import logging
+import time
 from datetime import datetime
+from typing import Optional, Tuple
 from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
@@ -9,6 +11,36 @@ logger = logging.getLogger(__name__)
 TORONTO_TZ = ZoneInfo('America/Toronto')
 UTC_TZ = ZoneInfo('UTC')
 
+# (epoch second, 'YYYY-MM-DDTHH:MM:SS') of the last utc_now_iso() call; one
+# tuple so concurrent callers never see a second paired with another's prefix
+_utc_second_prefix: Tuple[Optional[int], str] = (None, '')
+
+
+def parse_utc_iso(utc_datetime_str: str) -> datetime:
+    """
+    Parse an ISO format UTC datetime string into a timezone-aware datetime.
+    Naive values are assumed to be UTC.
+    
+    Only a trailing 'Z' is rewritten (by slicing) so the string goes straight
+    to the C-implemented datetime.fromisoformat without a full replace() scan.
+    
+    Args:
+        utc_datetime_str: ISO format datetime string in UTC
+                        (e.g., "2025-11-04T04:04:25.206644Z" or "2025-11-04T04:04:25+00:00")
+        
+    Returns:
+        Timezone-aware datetime object
+        
+    Raises:
+        ValueError: If datetime string cannot be parsed
+    """
+    if utc_datetime_str.endswith('Z'):
+        utc_datetime_str = utc_datetime_str[:-1] + '+00:00'
+    dt = datetime.fromisoformat(utc_datetime_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC_TZ)
+    return dt
+
 
 def convert_toronto_to_utc(toronto_datetime_str: str) -> datetime:
     """
@@ -52,38 +84,52 @@ def convert_toronto_to_utc(toronto_datetime_str: str) -> datetime:
     return dt_toronto.astimezone(UTC_TZ)
 
 
-def convert_utc_to_toronto(utc_datetime_str: str) -> str:
+def utc_now_iso() -> str:
+    """
+    Get the current time as an ISO UTC string with a 'Z' suffix.
+    
+    Matches datetime.now(timezone.utc).isoformat() with the '+00:00' offset
+    written as 'Z', except that microseconds are always included (e.g.
+    "2025-11-04T04:04:25.000000Z"). No datetime is built: the date/time
+    prefix is formatted once per second and only the microseconds change
+    between calls.
+    
+    Returns:
+        ISO format datetime string in UTC
+    """
+    global _utc_second_prefix
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _utc_second_prefix
+    if seconds != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+        _utc_second_prefix = (seconds, prefix)
+    return f"{prefix}.{nanoseconds // 1000:06d}Z"
+
+
+def utc_to_toronto_datetime(utc_datetime_str: str) -> datetime:
     """
-    Convert a UTC datetime string to Toronto timezone datetime string.
+    Convert a UTC datetime string to a Toronto timezone datetime.
     Handles daylight saving time automatically via zoneinfo.
     
+    Returning the datetime (rather than a string) lets the orjson JSON provider
+    format it natively; orjson emits the same ISO 8601 text as isoformat().
+    
     Args:
         utc_datetime_str: ISO format datetime string in UTC
                         (e.g., "2025-11-04T04:04:25.206644Z" or "2025-11-04T04:04:25+00:00")
         
     Returns:
-        ISO format datetime string in Toronto timezone
-        (e.g., "2025-11-04T00:04:25.206644-04:00" for EDT or "-05:00" for EST)
+        Timezone-aware datetime in Toronto time
         
     Raises:
         ValueError: If datetime string cannot be parsed
     """
     try:
-        # Parse the UTC datetime string
-        # Handle 'Z' suffix (UTC indicator)
-        datetime_str = utc_datetime_str.replace('Z', '+00:00')
-        dt_utc = datetime.fromisoformat(datetime_str)
-        
-        # Ensure it's in UTC
-        if dt_utc.tzinfo is None:
-            dt_utc = dt_utc.replace(tzinfo=UTC_TZ)
-        
-        # Convert to Toronto timezone
-        dt_toronto = dt_utc.astimezone(TORONTO_TZ)
-        
-        # Return as ISO format string with timezone offset
-        return dt_toronto.isoformat()
+        # Parse the UTC datetime string (handles 'Z' suffix and naive values)
+        dt_utc = parse_utc_iso(utc_datetime_str)
     except ValueError as e:
         logger.error(f"Failed to parse UTC datetime string: {utc_datetime_str}")
         raise ValueError(f"Invalid UTC datetime format: {e}") from e
-
+    
+    # Convert to Toronto timezone
+    return dt_utc.astimezone(TORONTO_TZ)
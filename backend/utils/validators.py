@@ -1,8 +1,53 @@
 """Validation utilities for request data."""
-from typing import Optional
+import logging
+from typing import Dict, Optional, Tuple
+import orjson
+from flask import Response
 from config import get_config
+from constants import HTTP_BAD_REQUEST
 
 Config = get_config()
+logger = logging.getLogger(__name__)
+
+# Messages for missing credentials, shared by the validators and the
+# pre-serialized responses below
+USERNAME_REQUIRED_MESSAGE = "Username is required"
+PASSWORD_REQUIRED_MESSAGE = "Password is required"
+
+_REQUIRED_FIELD_MESSAGES: Dict[str, str] = {
+    'username': USERNAME_REQUIRED_MESSAGE,
+    'password': PASSWORD_REQUIRED_MESSAGE,
+}
+
+# Pre-serialized ValidationError bodies for missing credentials, the most common
+# validation failure on the auth endpoints
+_REQUIRED_FIELD_BODIES: Dict[str, bytes] = {
+    field: orjson.dumps({'error': message, 'details': {'field': field}}) + b'\n'
+    for field, message in _REQUIRED_FIELD_MESSAGES.items()
+}
+
+
+def required_field_response(field: str) -> Tuple[Response, int]:
+    """
+    Build the 400 response for a missing username or password.
+    
+    Equivalent to raising ValidationError('<Field> is required', field=field),
+    including the warning handle_api_exception logs, without the exception
+    dispatch and serialization.
+    
+    Args:
+        field: 'username' or 'password'
+        
+    Returns:
+        Tuple of (response, status_code)
+    """
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "API exception: %s",
+            _REQUIRED_FIELD_MESSAGES[field],
+            extra={'status_code': HTTP_BAD_REQUEST, 'details': {'field': field}}
+        )
+    return Response(_REQUIRED_FIELD_BODIES[field], mimetype='application/json'), HTTP_BAD_REQUEST
 
 
 def validate_temperature(tempC: float) -> tuple[bool, Optional[str]]:
@@ -35,7 +80,7 @@ def validate_username(username: str) -> tuple[bool, Optional[str]]:
         Tuple of (is_valid, error_message)
     """
     if not username:
-        return False, "Username is required"
+        return False, USERNAME_REQUIRED_MESSAGE
     
     if not isinstance(username, str):
         return False, "Username must be a string"
@@ -66,7 +111,7 @@ def validate_password(password: str) -> tuple[bool, Optional[str]]:
         Tuple of (is_valid, error_message)
     """
     if not password:
-        return False, "Password is required"
+        return False, PASSWORD_REQUIRED_MESSAGE
     
     if not isinstance(password, str):
         return False, "Password must be a string"